@@ -1,10 +1,19 @@
 """Main Streamlit application entry point."""
 
+import random
 from datetime import date
 
 import streamlit as st
 
-from hr_dashboard.data_manager import get_hr_data, force_regenerate, get_filtered_data
+from hr_dashboard.data_manager import (
+    get_hr_data,
+    force_regenerate,
+    get_cached_filtered_data,
+    get_data_version,
+    get_filter_options,
+    get_generation_params,
+    public_tables,
+)
 from hr_dashboard.filters import (
     render_sidebar_filters,
     render_data_summary,
@@ -13,6 +22,10 @@ from hr_dashboard.filters import (
 )
 from hr_dashboard.views import overview, compensation, performance, org_chart, org_network, geography, attrition, data_tables
 
+# Seed for the first dataset of every session, so unchanged settings reload the
+# same data from the disk cache across restarts ("Regenerate Data" draws a new one)
+DEFAULT_SEED = 42
+
 
 def main():
     """Main application entry point."""
@@ -43,19 +56,23 @@ def main():
         st.session_state["growth_rate_pct"] = 5
     if "backfill_rate_pct" not in st.session_state:
         st.session_state["backfill_rate_pct"] = 85
+    if "seed" not in st.session_state:
+        st.session_state["seed"] = DEFAULT_SEED
+
+    # Resolve today's date once so every date range in this run agrees
+    today = date.today()
 
     # Generate initial data if not cached (first load only)
     # Uses current session state values as defaults
     if "hr_data" not in st.session_state:
-        end_date = date.today()
-        start_date = date(end_date.year - st.session_state["years_of_history"], 1, 1)
         data = get_hr_data(
             st.session_state["n_employees"],
+            seed=st.session_state["seed"],
             include_attrition=st.session_state["enable_attrition"],
             attrition_rate=st.session_state["attrition_rate_pct"] / 100,
             noise_std=st.session_state["noise_std"],
-            start_date=start_date,
-            end_date=end_date,
+            start_date=date(today.year - st.session_state["years_of_history"], 1, 1),
+            end_date=today,
             include_hiring=st.session_state["enable_hiring"],
             base_growth_rate=st.session_state["growth_rate_pct"] / 100,
             backfill_rate=st.session_state["backfill_rate_pct"] / 100,
@@ -63,8 +80,8 @@ def main():
     else:
         data = st.session_state["hr_data"]
 
-    # Render sidebar filters (uses cached data for filter options)
-    filters = render_sidebar_filters(data)
+    # Render sidebar filters (options cached per data version)
+    filters = render_sidebar_filters(get_filter_options(data, get_data_version()), today)
 
     # Update pending settings in session state (but don't regenerate yet)
     st.session_state["n_employees"] = filters["n_employees"]
@@ -78,16 +95,15 @@ def main():
 
     # Only regenerate when user explicitly clicks "Regenerate Data" button
     if filters["regenerate"]:
-        years = filters["years_of_history"]
-        end_date = date.today()
-        start_date = date(end_date.year - years, 1, 1)
+        st.session_state["seed"] = random.randrange(2**31)
         data = force_regenerate(
             filters["n_employees"],
+            seed=st.session_state["seed"],
             include_attrition=filters["enable_attrition"],
             attrition_rate=filters["attrition_rate"] / 100,
             noise_std=filters["noise_std"],
-            start_date=start_date,
-            end_date=end_date,
+            start_date=date(today.year - filters["years_of_history"], 1, 1),
+            end_date=today,
             include_hiring=filters["enable_hiring"],
             base_growth_rate=filters["growth_rate"] / 100,
             backfill_rate=filters["backfill_rate"] / 100,
@@ -96,18 +112,33 @@ def main():
 
     # Get the actual generation parameters from the cached data
     # (stored in session state by data_manager when data was generated)
-    start_date = st.session_state.get("hr_data_start_date", date.today().replace(month=1, day=1))
-    end_date = st.session_state.get("hr_data_end_date", date.today())
-    data_include_hiring = st.session_state.get("hr_data_include_hiring", False)
-
-    # Apply filters
-    filtered_data = get_filtered_data(
-        data,
-        business_units=filters["business_units"],
-        seniority_levels=filters["seniority_levels"],
-        salary_range=filters["salary_range"],
-        countries=filters["countries"],
+    generation_params = get_generation_params()
+    start_date = generation_params.get("start_date") or today.replace(month=1, day=1)
+    end_date = generation_params.get("end_date") or today
+    data_include_hiring = generation_params.get("include_hiring", False)
+
+    # Apply filters, reusing last result when neither data nor filters changed
+    filter_key = (
+        get_data_version(),
+        tuple(filters["business_units"]),
+        tuple(filters["seniority_levels"]),
+        filters["salary_range"],
+        tuple(filters["countries"]),
     )
+    if st.session_state.get("filter_key") == filter_key and "filtered_data" in st.session_state:
+        filtered_data = st.session_state["filtered_data"]
+    else:
+        data_version, business_units, seniority_levels, salary_range, countries = filter_key
+        filtered_data = get_cached_filtered_data(
+            data,
+            data_version,
+            business_units=business_units,
+            seniority_levels=seniority_levels,
+            salary_range=salary_range,
+            countries=countries,
+        )
+        st.session_state["filtered_data"] = filtered_data
+        st.session_state["filter_key"] = filter_key
 
     # Render data summary
     render_data_summary(filtered_data)
@@ -121,36 +152,51 @@ def main():
     )
 
     # Render download buttons
-    render_download_buttons(filtered_data)
-
-    # Main content tabs (tab label reflects actual data, not pending settings)
-    tab_overview, tab_org, tab_compensation, tab_performance, tab_attrition, tab_map, tab_data = st.tabs([
-        "Overview",
-        "Organization",
-        "Compensation",
-        "Performance",
-        "Workforce Dynamics" if data_include_hiring else "Attrition",
-        "Map",
-        "📋 Data Tables",
-    ])
-
-    with tab_overview:
+    render_download_buttons(public_tables(filtered_data), filter_key)
+
+    # Main content view selector (label reflects actual data, not pending settings).
+    # Unlike st.tabs, only the selected view is rendered on each rerun.
+    view_labels = {
+        "overview": "Overview",
+        "organization": "Organization",
+        "compensation": "Compensation",
+        "performance": "Performance",
+        "attrition": "Workforce Dynamics" if data_include_hiring else "Attrition",
+        "map": "Map",
+        "data": "📋 Data Tables",
+    }
+    active_view = st.radio(
+        "View",
+        options=list(view_labels),
+        format_func=view_labels.get,
+        horizontal=True,
+        key="active_view",
+        label_visibility="collapsed",
+    )
+
+    if active_view == "overview":
         overview.render(filtered_data)
 
-    with tab_org:
-        org_subtab1, org_subtab2 = st.tabs(["Tree View", "Network View"])
-        with org_subtab1:
+    elif active_view == "organization":
+        org_view = st.radio(
+            "Organization View",
+            options=["Tree View", "Network View"],
+            horizontal=True,
+            key="active_org_view",
+            label_visibility="collapsed",
+        )
+        if org_view == "Tree View":
             org_chart.render(filtered_data)
-        with org_subtab2:
+        else:
             org_network.render(filtered_data)
 
-    with tab_compensation:
+    elif active_view == "compensation":
         compensation.render(filtered_data)
 
-    with tab_performance:
+    elif active_view == "performance":
         performance.render(filtered_data)
 
-    with tab_attrition:
+    elif active_view == "attrition":
         attrition.render(
             filtered_data,
             include_hiring=data_include_hiring,
@@ -158,11 +204,11 @@ def main():
             end_year=end_date.year,
         )
 
-    with tab_map:
+    elif active_view == "map":
         geography.render(filtered_data)
 
-    with tab_data:
-        data_tables.render(filtered_data)
+    elif active_view == "data":
+        data_tables.render(public_tables(filtered_data))
 
 
 if __name__ == "__main__":
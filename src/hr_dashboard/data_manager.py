@@ -1,11 +1,72 @@
 """Data generation and caching manager."""
 
+import itertools
 from datetime import date
+from typing import Any
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 from hr_data_generator import ProgressInfo, generate_hr_data
 
+from hr_dashboard.utils.disk_cache import load_cached_dataset, save_cached_dataset
+from hr_dashboard.utils.employee_tables import (
+    employee_id_lookup,
+    latest_per_employee,
+    rows_for_employees,
+)
+
+# Session state keys for the cached dataset, its generation parameters and version
+DATA_KEY = "hr_data"
+PARAMS_KEY = "hr_data_params"
+VERSION_KEY = "hr_data_version"
+
+# Process-wide counter so every generated dataset gets a unique version,
+# even across sessions sharing the st.cache_data store
+_data_versions = itertools.count(1)
+
+# Derived tables are stored under "_"-prefixed keys alongside the generated ones
+# Key for the enriched employee table precomputed at generation time
+ENRICHED_KEY = "_enriched"
+
+# Keys for the current-assignment snapshots (latest row per employee)
+CURRENT_SNAPSHOT_KEYS = {
+    "employee_job_assignment": "_current_job_assignment",
+    "employee_org_assignment": "_current_org_assignment",
+    "employee_compensation": "_current_compensation",
+}
+
+# Tables with one or more rows per employee, filtered by employee ID
+EMPLOYEE_TABLES = (
+    "employee",
+    "employee_job_assignment",
+    "employee_org_assignment",
+    "employee_compensation",
+    "employee_performance",
+    *CURRENT_SNAPSHOT_KEYS.values(),
+)
+
+# Low-cardinality string columns stored as categoricals in every table
+CATEGORICAL_COLUMNS = (
+    "business_unit",
+    "org_name",
+    "country",
+    "region",
+    "currency",
+    "gender",
+    "employment_type",
+    "job_family",
+    "change_reason",
+    "employment_status",
+    "termination_reason",
+)
+
+# Integer columns downcast to the smallest dtype holding their values
+DOWNCAST_COLUMNS = ("employee_id", "seniority_level")
+
+# Low-cardinality filter columns stored as categoricals in the enriched table
+CATEGORICAL_FILTER_COLUMNS = ("business_unit", "country", "seniority_level")
+
 
 def get_hr_data(
     n_employees: int,
@@ -24,6 +85,8 @@ def get_hr_data(
 
     Uses Streamlit session state to cache generated data.
     Data is only regenerated when parameters change or explicitly requested.
+    Seeded datasets are additionally persisted to disk as Parquet, so the
+    same parameters load without regeneration across app restarts.
 
     Args:
         n_employees: Number of employees to generate
@@ -40,72 +103,60 @@ def get_hr_data(
     Returns:
         Dictionary of DataFrames from hr_data_generator
     """
-    cache_key = "hr_data"
-    count_key = "hr_data_n_employees"
-    seed_key = "hr_data_seed"
-    attrition_key = "hr_data_include_attrition"
-    attrition_rate_key = "hr_data_attrition_rate"
-    noise_key = "hr_data_noise_std"
-    start_date_key = "hr_data_start_date"
-    end_date_key = "hr_data_end_date"
-    hiring_key = "hr_data_include_hiring"
-    growth_rate_key = "hr_data_growth_rate"
-    backfill_rate_key = "hr_data_backfill_rate"
-
-    # Check if we need to regenerate
-    needs_regeneration = (
-        cache_key not in st.session_state
-        or st.session_state.get(count_key) != n_employees
-        or st.session_state.get(seed_key) != seed
-        or st.session_state.get(attrition_key) != include_attrition
-        or st.session_state.get(attrition_rate_key) != attrition_rate
-        or st.session_state.get(noise_key) != noise_std
-        or st.session_state.get(start_date_key) != start_date
-        or st.session_state.get(end_date_key) != end_date
-        or st.session_state.get(hiring_key) != include_hiring
-        or st.session_state.get(growth_rate_key) != base_growth_rate
-        or st.session_state.get(backfill_rate_key) != backfill_rate
-    )
+    params = {
+        "n_employees": n_employees,
+        "seed": seed,
+        "include_attrition": include_attrition,
+        "attrition_rate": attrition_rate,
+        "noise_std": noise_std,
+        "start_date": start_date,
+        "end_date": end_date,
+        "include_hiring": include_hiring,
+        "base_growth_rate": base_growth_rate,
+        "backfill_rate": backfill_rate,
+    }
+
+    # Regenerate only when the requested parameters differ from the cached data's
+    if DATA_KEY not in st.session_state or st.session_state.get(PARAMS_KEY) != params:
+        # Seeded datasets are deterministic, so they can be reused from disk;
+        # unseeded ones must stay random on every regeneration
+        data = load_cached_dataset(params) if seed is not None else None
+        if data is None:
+            data = _generate_with_progress(params)
+            if seed is not None:
+                save_cached_dataset(params, data)
+
+        st.session_state[DATA_KEY] = _prepare_hr_data(data)
+        st.session_state[PARAMS_KEY] = params
+        st.session_state[VERSION_KEY] = next(_data_versions)
+
+    return st.session_state[DATA_KEY]
+
+
+def _generate_with_progress(params: dict[str, Any]) -> dict[str, pd.DataFrame]:
+    """
+    Run hr_data_generator while showing progress in the Streamlit UI.
+
+    Args:
+        params: Keyword arguments for generate_hr_data
+
+    Returns:
+        Dictionary of DataFrames from hr_data_generator
+    """
+    with st.status("Generating HR data...", expanded=True) as status:
+        progress_bar = st.progress(0.0)
+        status_text = st.empty()
+
+        def on_progress(info: ProgressInfo) -> None:
+            """Update Streamlit progress UI with generation progress."""
+            progress_bar.progress(min(info.progress, 1.0))
+            status_text.text(info.message)
 
-    if needs_regeneration:
-        with st.status("Generating HR data...", expanded=True) as status:
-            progress_bar = st.progress(0.0)
-            status_text = st.empty()
-
-            def on_progress(info: ProgressInfo) -> None:
-                """Update Streamlit progress UI with generation progress."""
-                progress_bar.progress(min(info.progress, 1.0))
-                status_text.text(info.message)
-
-            data = generate_hr_data(
-                n_employees=n_employees,
-                seed=seed,
-                include_attrition=include_attrition,
-                attrition_rate=attrition_rate,
-                noise_std=noise_std,
-                start_date=start_date,
-                end_date=end_date,
-                include_hiring=include_hiring,
-                base_growth_rate=base_growth_rate,
-                backfill_rate=backfill_rate,
-                progress_callback=on_progress,
-            )
-            progress_bar.progress(1.0)
-            status.update(label="Data generation complete!", state="complete")
-
-            st.session_state[cache_key] = data
-            st.session_state[count_key] = n_employees
-            st.session_state[seed_key] = seed
-            st.session_state[attrition_key] = include_attrition
-            st.session_state[attrition_rate_key] = attrition_rate
-            st.session_state[noise_key] = noise_std
-            st.session_state[start_date_key] = start_date
-            st.session_state[end_date_key] = end_date
-            st.session_state[hiring_key] = include_hiring
-            st.session_state[growth_rate_key] = base_growth_rate
-            st.session_state[backfill_rate_key] = backfill_rate
-
-    return st.session_state[cache_key]
+        data = generate_hr_data(**params, progress_callback=on_progress)
+        progress_bar.progress(1.0)
+        status.update(label="Data generation complete!", state="complete")
+
+    return data
 
 
 def force_regenerate(
@@ -139,22 +190,8 @@ def force_regenerate(
         Dictionary of DataFrames from hr_data_generator
     """
     # Clear cache to force regeneration
-    keys_to_clear = [
-        "hr_data",
-        "hr_data_n_employees",
-        "hr_data_seed",
-        "hr_data_include_attrition",
-        "hr_data_attrition_rate",
-        "hr_data_noise_std",
-        "hr_data_start_date",
-        "hr_data_end_date",
-        "hr_data_include_hiring",
-        "hr_data_growth_rate",
-        "hr_data_backfill_rate",
-    ]
-    for key in keys_to_clear:
-        if key in st.session_state:
-            del st.session_state[key]
+    for key in (DATA_KEY, PARAMS_KEY, VERSION_KEY):
+        st.session_state.pop(key, None)
 
     return get_hr_data(
         n_employees,
@@ -170,6 +207,185 @@ def force_regenerate(
     )
 
 
+def _prepare_hr_data(data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """
+    Precompute derived tables once per generated dataset.
+
+    Args:
+        data: Dictionary of DataFrames from hr_data_generator
+
+    Returns:
+        The same dictionary with compact column dtypes, and with
+        current-assignment snapshots and the enriched employee table added
+    """
+    for df in data.values():
+        _compact_dtypes(df)
+
+    for table, snapshot_key in CURRENT_SNAPSHOT_KEYS.items():
+        if table in data:
+            data[snapshot_key] = latest_per_employee(data[table])
+
+    data[ENRICHED_KEY] = _build_filter_table(data)
+    return data
+
+
+def _compact_dtypes(df: pd.DataFrame) -> None:
+    """
+    Convert columns of a generated table to compact dtypes in place.
+
+    Low-cardinality strings become categoricals, and integer key/level
+    columns are downcast (e.g. employee_id to uint16, seniority_level to
+    uint8). Non-integer columns such as string IDs are left unchanged.
+
+    Args:
+        df: Table from hr_data_generator
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    for col in DOWNCAST_COLUMNS:
+        if col in df.columns and df[col].dtype.kind in "iu":
+            downcast = "unsigned" if len(df) and df[col].min() >= 0 else "integer"
+            df[col] = pd.to_numeric(df[col], downcast=downcast)
+
+
+def _build_filter_table(data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Build the enriched employee table used for filtering.
+
+    Filter columns are converted to categoricals so membership tests run
+    over small integer codes instead of hashing every value.
+
+    Args:
+        data: HR data dictionary
+
+    Returns:
+        Enriched employee DataFrame with categorical filter columns
+    """
+    enriched = enrich_employee_data(data)
+    for col in CATEGORICAL_FILTER_COLUMNS:
+        if col in enriched.columns:
+            enriched[col] = enriched[col].astype("category")
+    return enriched
+
+
+def _category_mask(values: pd.Series, selected) -> np.ndarray:
+    """
+    Compute an isin mask for a categorical column via its integer codes.
+
+    Args:
+        values: Categorical Series
+        selected: Values to keep
+
+    Returns:
+        Boolean numpy array (missing values are never selected)
+    """
+    wanted = np.flatnonzero(values.cat.categories.isin(selected))
+    return np.isin(values.cat.codes.to_numpy(), wanted)
+
+
+def get_data_version() -> int:
+    """
+    Get the version of the currently cached HR data.
+
+    The version changes every time data is (re)generated, making it a cheap
+    cache key in place of hashing the DataFrames themselves.
+
+    Returns:
+        Data version, or 0 if no data has been generated yet
+    """
+    return st.session_state.get(VERSION_KEY, 0)
+
+
+def get_generation_params() -> dict[str, Any]:
+    """
+    Get the parameters the currently cached HR data was generated with.
+
+    Returns:
+        get_hr_data keyword arguments, or an empty dict if no data exists yet
+    """
+    return st.session_state.get(PARAMS_KEY, {})
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_filter_options(_data: dict[str, pd.DataFrame], data_version: int) -> dict[str, Any]:
+    """
+    Compute sidebar filter options, cached per data version.
+
+    Args:
+        _data: Raw HR data dictionary (unfiltered, excluded from cache key)
+        data_version: Version of the raw data (see get_data_version)
+
+    Returns:
+        Dictionary with business_units, countries and seniority_levels option
+        lists, and salary_min_max as (min, max) or None without compensation data
+    """
+    options = {
+        "business_units": _category_values(_data["organization_unit"]["business_unit"]),
+        "countries": _category_values(_data["location"]["country"]),
+        "seniority_levels": sorted(_data["job_role"]["seniority_level"].dropna().unique().tolist()),
+        "salary_min_max": None,
+    }
+
+    if "employee_compensation" in _data:
+        comp_df = _data["employee_compensation"]
+        options["salary_min_max"] = (
+            float(comp_df["base_salary"].min()),
+            float(comp_df["base_salary"].max()),
+        )
+
+    return options
+
+
+def _category_values(values: pd.Series) -> list:
+    """
+    Return the sorted distinct non-null values of a column.
+
+    Args:
+        values: Column values (categorical columns read their categories directly)
+
+    Returns:
+        Sorted list of values
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.categories.tolist()
+    return sorted(values.dropna().unique().tolist())
+
+
+def get_current_snapshot(data: dict[str, pd.DataFrame], table: str) -> pd.DataFrame:
+    """
+    Get the latest row per employee of a time-variant table.
+
+    Uses the snapshot precomputed by _prepare_hr_data (and carried through
+    get_filtered_data) when present, otherwise computes it.
+
+    Args:
+        data: HR data dictionary
+        table: Name of a time-variant table in CURRENT_SNAPSHOT_KEYS
+
+    Returns:
+        DataFrame with one row per employee
+    """
+    snapshot = data.get(CURRENT_SNAPSHOT_KEYS[table])
+    if snapshot is None:
+        snapshot = latest_per_employee(data[table])
+    return snapshot
+
+
+def public_tables(data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """
+    Get the generated tables of an HR data dictionary, without derived ones.
+
+    Args:
+        data: HR data dictionary
+
+    Returns:
+        Dictionary without the "_"-prefixed derived tables (for export/display)
+    """
+    return {name: df for name, df in data.items() if not name.startswith("_")}
+
+
 def get_filtered_data(
     data: dict[str, pd.DataFrame],
     business_units: list[str] | None = None,
@@ -194,90 +410,60 @@ def get_filtered_data(
     """
     result = {}
 
-    # Get employee IDs that pass all filters
-    employees_df = data["employee"].copy()
-    job_assignments = data["employee_job_assignment"].copy()
-    org_assignments = data["employee_org_assignment"].copy()
-    job_roles = data["job_role"]
-    org_units = data["organization_unit"]
-    locations = data["location"]
-
-    # Get current job assignments (most recent)
-    current_jobs = job_assignments.sort_values("start_date", ascending=False).drop_duplicates(
-        "employee_id", keep="first"
-    )
+    # Use the enriched table built at generation time when available
+    employees_enriched = data.get(ENRICHED_KEY)
+    if employees_enriched is None:
+        employees_enriched = _build_filter_table(data)
 
-    # Get current org assignments (most recent)
-    current_orgs = org_assignments.sort_values("start_date", ascending=False).drop_duplicates(
-        "employee_id", keep="first"
-    )
-
-    # Merge for filtering
-    employees_enriched = employees_df.merge(
-        current_jobs[["employee_id", "job_id"]], on="employee_id", how="left"
-    )
-    employees_enriched = employees_enriched.merge(
-        job_roles[["job_id", "seniority_level"]], on="job_id", how="left"
-    )
-    employees_enriched = employees_enriched.merge(
-        current_orgs[["employee_id", "org_id"]], on="employee_id", how="left"
-    )
-    employees_enriched = employees_enriched.merge(
-        org_units[["org_id", "business_unit"]], on="org_id", how="left"
-    )
-    employees_enriched = employees_enriched.merge(
-        locations[["location_id", "country"]], on="location_id", how="left"
-    )
-
-    # Apply filters
-    mask = pd.Series([True] * len(employees_enriched), index=employees_enriched.index)
+    # Collect one boolean array per active filter and combine them once
+    masks = []
 
     if business_units:
         # Include employees with NULL business_unit OR matching business_unit
-        mask &= (
-            employees_enriched["business_unit"].isin(business_units)
-            | employees_enriched["business_unit"].isna()
+        business_unit = employees_enriched["business_unit"]
+        masks.append(
+            _category_mask(business_unit, business_units)
+            | (business_unit.cat.codes.to_numpy() == -1)
         )
 
     if seniority_levels:
-        mask &= employees_enriched["seniority_level"].isin(seniority_levels)
+        masks.append(_category_mask(employees_enriched["seniority_level"], seniority_levels))
 
     if countries:
-        mask &= employees_enriched["country"].isin(countries)
-
-    # Filter for salary range using compensation data
-    if salary_range and "employee_compensation" in data:
-        comp_df = data["employee_compensation"].copy()
-        current_comp = comp_df.sort_values("start_date", ascending=False).drop_duplicates(
-            "employee_id", keep="first"
-        )
-        salary_mask = (current_comp["base_salary"] >= salary_range[0]) & (
-            current_comp["base_salary"] <= salary_range[1]
-        )
-        valid_emp_ids = current_comp.loc[salary_mask, "employee_id"]
-        mask &= employees_enriched["employee_id"].isin(valid_emp_ids)
-
-    # Get filtered employee IDs
-    filtered_emp_ids = employees_enriched.loc[mask, "employee_id"]
-
-    # Filter all tables
-    result["employee"] = employees_df[employees_df["employee_id"].isin(filtered_emp_ids)]
-    result["employee_job_assignment"] = job_assignments[
-        job_assignments["employee_id"].isin(filtered_emp_ids)
-    ]
-    result["employee_org_assignment"] = org_assignments[
-        org_assignments["employee_id"].isin(filtered_emp_ids)
-    ]
-
-    if "employee_compensation" in data:
-        result["employee_compensation"] = data["employee_compensation"][
-            data["employee_compensation"]["employee_id"].isin(filtered_emp_ids)
-        ]
-
-    if "employee_performance" in data:
-        result["employee_performance"] = data["employee_performance"][
-            data["employee_performance"]["employee_id"].isin(filtered_emp_ids)
-        ]
+        masks.append(_category_mask(employees_enriched["country"], countries))
+
+    # Filter for salary range on the current salary already in the enriched table
+    # (employees without compensation records never match)
+    if salary_range and "base_salary" in employees_enriched.columns:
+        salaries = employees_enriched["base_salary"].to_numpy()
+        masks.append((salaries >= salary_range[0]) & (salaries <= salary_range[1]))
+
+    if masks:
+        mask = np.logical_and.reduce(masks)
+    else:
+        mask = np.ones(len(employees_enriched), dtype=bool)
+
+    employee_tables = [name for name in EMPLOYEE_TABLES if name in data]
+
+    if mask.all():
+        # Every employee passes (e.g. all filters at their select-all defaults):
+        # share the unfiltered tables instead of reselecting every row
+        for name in employee_tables:
+            result[name] = data[name]
+        result[ENRICHED_KEY] = employees_enriched
+    else:
+        # Get filtered employee IDs (sorted once, reused for every table)
+        all_emp_ids = employees_enriched["employee_id"].to_numpy()
+        filtered_emp_ids = np.sort(all_emp_ids[mask])
+        lookup = employee_id_lookup(all_emp_ids, filtered_emp_ids)
+
+        # Filter the employee tables, including the current-assignment snapshots
+        # so views don't recompute them
+        for name in employee_tables:
+            result[name] = rows_for_employees(data[name], filtered_emp_ids, lookup)
+
+        # Carry the matching enriched rows so views skip the lookups entirely
+        result[ENRICHED_KEY] = employees_enriched[mask].reset_index(drop=True)
 
     # Reference tables stay unfiltered
     result["organization_unit"] = data["organization_unit"]
@@ -287,66 +473,123 @@ def get_filtered_data(
     return result
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_cached_filtered_data(
+    _data: dict[str, pd.DataFrame],
+    data_version: int,
+    business_units: tuple[str, ...] | None = None,
+    seniority_levels: tuple[int, ...] | None = None,
+    salary_range: tuple[float, float] | None = None,
+    countries: tuple[str, ...] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Apply filters to HR data, caching the result per data version and filter state.
+
+    The data dictionary itself is excluded from the cache key (leading
+    underscore); ``data_version`` identifies it instead. Filter values must
+    be hashable, so pass tuples rather than lists.
+
+    Args:
+        _data: Raw HR data dictionary
+        data_version: Version of the raw data (see get_data_version)
+        business_units: Filter by business units
+        seniority_levels: Filter by seniority levels (1-5)
+        salary_range: Filter by salary range (min, max)
+        countries: Filter by countries
+
+    Returns:
+        Filtered dictionary of DataFrames
+    """
+    return get_filtered_data(
+        _data,
+        business_units=business_units,
+        seniority_levels=seniority_levels,
+        salary_range=salary_range,
+        countries=countries,
+    )
+
+
+def _map_columns(
+    keys: pd.Series, table: pd.DataFrame, key: str, columns: list[str]
+) -> dict[str, pd.Series]:
+    """
+    Look up columns from a table with unique keys (a left join without merge).
+
+    Args:
+        keys: Key values to look up
+        table: Lookup table with one row per key
+        key: Key column in table
+        columns: Columns of table to return
+
+    Returns:
+        Dictionary of column name to Series aligned with keys
+    """
+    indexed = table.set_index(key)
+    return {col: keys.map(indexed[col]) for col in columns}
+
+
 def enrich_employee_data(data: dict[str, pd.DataFrame]) -> pd.DataFrame:
     """
     Create enriched employee DataFrame with current job, org, and compensation info.
 
+    Data from get_hr_data or get_filtered_data already carries this table,
+    which is returned as-is (with categorical filter columns); treat it as
+    read-only and copy before adding columns.
+
     Args:
         data: HR data dictionary
 
     Returns:
         Enriched employee DataFrame
     """
-    employees_df = data["employee"].copy()
-    job_assignments = data["employee_job_assignment"]
-    org_assignments = data["employee_org_assignment"]
+    if ENRICHED_KEY in data:
+        return data[ENRICHED_KEY]
+
+    employees_df = data["employee"]
     job_roles = data["job_role"]
     org_units = data["organization_unit"]
     locations = data["location"]
 
     # Get current assignments
-    current_jobs = job_assignments.sort_values("start_date", ascending=False).drop_duplicates(
-        "employee_id", keep="first"
-    )
-    current_orgs = org_assignments.sort_values("start_date", ascending=False).drop_duplicates(
-        "employee_id", keep="first"
+    current_jobs = get_current_snapshot(data, "employee_job_assignment")
+    current_orgs = get_current_snapshot(data, "employee_org_assignment")
+
+    # Look up columns by key with Series.map instead of chained merges
+    employee_ids = employees_df["employee_id"]
+    columns = {}
+
+    # Job info
+    columns["job_id"] = _map_columns(employee_ids, current_jobs, "employee_id", ["job_id"])["job_id"]
+    columns.update(
+        _map_columns(
+            columns["job_id"], job_roles, "job_id",
+            ["job_title", "job_family", "job_level", "seniority_level"],
+        )
     )
 
-    # Merge job info
-    employees_df = employees_df.merge(
-        current_jobs[["employee_id", "job_id"]], on="employee_id", how="left"
-    )
-    employees_df = employees_df.merge(
-        job_roles[["job_id", "job_title", "job_family", "job_level", "seniority_level"]],
-        on="job_id",
-        how="left",
+    # Org info
+    columns["org_id"] = _map_columns(employee_ids, current_orgs, "employee_id", ["org_id"])["org_id"]
+    columns.update(
+        _map_columns(columns["org_id"], org_units, "org_id", ["org_name", "business_unit"])
     )
 
-    # Merge org info
-    employees_df = employees_df.merge(
-        current_orgs[["employee_id", "org_id"]], on="employee_id", how="left"
-    )
-    employees_df = employees_df.merge(
-        org_units[["org_id", "org_name", "business_unit"]], on="org_id", how="left"
-    )
-
-    # Merge location info
-    employees_df = employees_df.merge(
-        locations[["location_id", "city", "country", "region", "latitude", "longitude"]],
-        on="location_id",
-        how="left",
+    # Location info
+    columns.update(
+        _map_columns(
+            employees_df["location_id"], locations, "location_id",
+            ["city", "country", "region", "latitude", "longitude"],
+        )
     )
 
     # Add compensation if available
     if "employee_compensation" in data:
-        comp_df = data["employee_compensation"]
-        current_comp = comp_df.sort_values("start_date", ascending=False).drop_duplicates(
-            "employee_id", keep="first"
-        )
-        employees_df = employees_df.merge(
-            current_comp[["employee_id", "base_salary", "currency"]],
-            on="employee_id",
-            how="left",
+        current_comp = get_current_snapshot(data, "employee_compensation")
+        columns.update(
+            _map_columns(employee_ids, current_comp, "employee_id", ["base_salary", "currency"])
         )
 
+    employees_df = pd.concat(
+        [employees_df, pd.DataFrame(columns, index=employees_df.index)], axis=1
+    ).reset_index(drop=True)
+
     return employees_df
@@ -1,29 +1,46 @@
 """Sidebar filter components."""
 
 import io
+import logging
 import zipfile
 from datetime import date
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 from typing import Any
 
+from hr_dashboard.data_manager import get_current_snapshot, get_generation_params
 from hr_dashboard.utils.data_health import run_health_checks
 from hr_dashboard.utils.export import (
     PARQUET_AVAILABLE,
-    create_zip_download,
+    PARQUET_ERRORS,
     get_total_export_size,
     export_to_csv,
     export_to_parquet,
+    export_tables,
+    zip_exported_files,
 )
 
+logger = logging.getLogger(__name__)
 
-def render_sidebar_filters(data: dict[str, pd.DataFrame]) -> dict[str, Any]:
+# Display labels for the seniority filter options
+SENIORITY_FILTER_LABELS = {
+    1: "1 - Entry",
+    2: "2 - Junior",
+    3: "3 - Mid",
+    4: "4 - Senior",
+    5: "5 - Executive",
+}
+
+
+def render_sidebar_filters(options: dict[str, Any], today: date) -> dict[str, Any]:
     """
     Render sidebar filter components.
 
     Args:
-        data: Raw HR data dictionary (unfiltered)
+        options: Filter options from data_manager.get_filter_options
+        today: Date resolved once per run, used for the pending date range
 
     Returns:
         Dictionary of filter values
@@ -107,7 +124,7 @@ def render_sidebar_filters(data: dict[str, pd.DataFrame]) -> dict[str, Any]:
         filters["backfill_rate"] = 85
 
     # Check if generation settings differ from last generated data
-    settings_changed = _check_settings_changed(filters)
+    settings_changed = _check_settings_changed(filters, today)
 
     # Regenerate button with visual indicator when settings changed
     if settings_changed:
@@ -129,8 +146,7 @@ def render_sidebar_filters(data: dict[str, pd.DataFrame]) -> dict[str, Any]:
     st.sidebar.header("View Filters")
 
     # Business Unit filter
-    org_units = data["organization_unit"]
-    business_units = sorted(org_units["business_unit"].dropna().unique().tolist())
+    business_units = options["business_units"]
     filters["business_units"] = st.sidebar.multiselect(
         "Business Unit",
         options=business_units,
@@ -139,8 +155,7 @@ def render_sidebar_filters(data: dict[str, pd.DataFrame]) -> dict[str, Any]:
     )
 
     # Country filter
-    locations = data["location"]
-    countries = sorted(locations["country"].dropna().unique().tolist())
+    countries = options["countries"]
     filters["countries"] = st.sidebar.multiselect(
         "Country",
         options=countries,
@@ -149,33 +164,19 @@ def render_sidebar_filters(data: dict[str, pd.DataFrame]) -> dict[str, Any]:
     )
 
     # Seniority Level filter
-    job_roles = data["job_role"]
-    seniority_levels = sorted(job_roles["seniority_level"].dropna().unique().tolist())
-    seniority_labels = {
-        1: "1 - Entry",
-        2: "2 - Junior",
-        3: "3 - Mid",
-        4: "4 - Senior",
-        5: "5 - Executive",
-    }
-    seniority_options = [seniority_labels.get(s, str(s)) for s in seniority_levels]
-
-    selected_seniority = st.sidebar.multiselect(
+    # Options are the integer levels themselves; only their display is labelled
+    seniority_levels = options["seniority_levels"]
+    filters["seniority_levels"] = st.sidebar.multiselect(
         "Seniority Level",
-        options=seniority_options,
-        default=seniority_options,
+        options=seniority_levels,
+        default=seniority_levels,
+        format_func=lambda level: SENIORITY_FILTER_LABELS.get(level, str(level)),
         help="Filter by seniority level",
     )
-    # Convert back to integers
-    filters["seniority_levels"] = [
-        int(s.split(" - ")[0]) for s in selected_seniority
-    ]
 
     # Salary Range filter (if compensation data exists)
-    if "employee_compensation" in data:
-        comp_df = data["employee_compensation"]
-        min_salary = float(comp_df["base_salary"].min())
-        max_salary = float(comp_df["base_salary"].max())
+    if options["salary_min_max"] is not None:
+        min_salary, max_salary = options["salary_min_max"]
 
         salary_range = st.sidebar.slider(
             "Salary Range",
@@ -192,44 +193,45 @@ def render_sidebar_filters(data: dict[str, pd.DataFrame]) -> dict[str, Any]:
     return filters
 
 
-def _check_settings_changed(filters: dict[str, Any]) -> bool:
+def _check_settings_changed(filters: dict[str, Any], today: date) -> bool:
     """
     Check if current filter settings differ from the last generated data.
 
-    Compares pending settings in filters against hr_data_* session state keys
-    that were set when data was actually generated.
+    Compares pending settings in filters against the generation parameters
+    recorded by data_manager when data was actually generated.
 
     Args:
         filters: Current filter values from sidebar
+        today: Date resolved once per run (same end date the app generates with)
 
     Returns:
         True if settings have changed and data needs regeneration
     """
-    from datetime import date
+    generated = get_generation_params()
 
     # If no data has been generated yet, no changes to detect
-    if "hr_data" not in st.session_state:
+    if not generated:
         return False
 
     # Calculate date range from filter's years_of_history
     years = filters["years_of_history"]
-    end_date = date.today()
+    end_date = today
     start_date = date(end_date.year - years, 1, 1)
 
     # Compare each setting against what data was generated with
-    checks = [
-        st.session_state.get("hr_data_n_employees") != filters["n_employees"],
-        st.session_state.get("hr_data_include_attrition") != filters["enable_attrition"],
-        st.session_state.get("hr_data_attrition_rate") != filters["attrition_rate"] / 100,
-        st.session_state.get("hr_data_noise_std") != filters["noise_std"],
-        st.session_state.get("hr_data_start_date") != start_date,
-        st.session_state.get("hr_data_end_date") != end_date,
-        st.session_state.get("hr_data_include_hiring") != filters["enable_hiring"],
-        st.session_state.get("hr_data_growth_rate") != filters["growth_rate"] / 100,
-        st.session_state.get("hr_data_backfill_rate") != filters["backfill_rate"] / 100,
-    ]
+    pending = {
+        "n_employees": filters["n_employees"],
+        "include_attrition": filters["enable_attrition"],
+        "attrition_rate": filters["attrition_rate"] / 100,
+        "noise_std": filters["noise_std"],
+        "start_date": start_date,
+        "end_date": end_date,
+        "include_hiring": filters["enable_hiring"],
+        "base_growth_rate": filters["growth_rate"] / 100,
+        "backfill_rate": filters["backfill_rate"] / 100,
+    }
 
-    return any(checks)
+    return any(generated.get(key) != value for key, value in pending.items())
 
 
 def render_data_summary(data: dict[str, pd.DataFrame]) -> None:
@@ -248,17 +250,19 @@ def render_data_summary(data: dict[str, pd.DataFrame]) -> None:
     st.sidebar.metric("Total Employees", n_employees)
 
     if "employee_compensation" in data:
-        comp_df = data["employee_compensation"]
         # Get current compensation
-        current_comp = comp_df.sort_values("start_date", ascending=False).drop_duplicates(
-            "employee_id", keep="first"
-        )
+        current_comp = get_current_snapshot(data, "employee_compensation")
         avg_salary = current_comp["base_salary"].mean()
         st.sidebar.metric("Avg Salary", f"${avg_salary:,.0f}")
 
     # Gender distribution
-    gender_counts = employees_df["gender"].value_counts()
-    gender_str = ", ".join([f"{k}: {v}" for k, v in gender_counts.items()])
+    # Count over the categorical codes (no-op conversion for prepared data)
+    gender = employees_df["gender"].astype("category")
+    codes = gender.cat.codes.to_numpy()
+    gender_counts = np.bincount(codes[codes >= 0], minlength=len(gender.cat.categories))
+    gender_str = ", ".join(
+        f"{k}: {v}" for k, v in zip(gender.cat.categories, gender_counts) if v > 0
+    )
     st.sidebar.caption(f"Gender: {gender_str}")
 
 
@@ -280,7 +284,13 @@ def render_health_panel(
     st.sidebar.divider()
     st.sidebar.subheader("Data Health")
 
-    checks = run_health_checks(data, start_year, end_year, include_hiring)
+    # Pass the precomputed current-assignment snapshots so the checks skip recomputing them
+    current_assignments = {
+        table: get_current_snapshot(data, table)
+        for table in ("employee_job_assignment", "employee_org_assignment")
+        if table in data
+    }
+    checks = run_health_checks(data, start_year, end_year, include_hiring, current_assignments)
 
     for check in checks:
         if check.status == "pass":
@@ -293,38 +303,79 @@ def render_health_panel(
             st.sidebar.error(f"**{check.name}**: {check.message}")
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
 def get_download_data(
-    data: dict[str, pd.DataFrame], format: str = "csv"
+    _data: dict[str, pd.DataFrame], data_key: tuple, format: str = "csv"
 ) -> dict[str, bytes]:
     """
-    Prepare data for download.
+    Prepare data for download, cached per dataset and format.
+
+    The data dictionary is excluded from the cache key (leading underscore);
+    ``data_key`` identifies it instead, so reruns with unchanged data reuse
+    the serialized bytes.
 
     Args:
-        data: HR data dictionary
+        _data: HR data dictionary
+        data_key: Hashable key identifying _data (data version and filters)
         format: Export format ("csv" or "parquet")
 
     Returns:
         Dictionary of table names to file bytes
     """
-    downloads = {}
     export_func = export_to_csv if format == "csv" else export_to_parquet
 
-    for name, df in data.items():
+    def export_table(name: str, df: pd.DataFrame) -> bytes:
         try:
-            downloads[name] = export_func(df)
-        except Exception:
-            # Fall back to CSV if parquet fails
-            downloads[name] = export_to_csv(df)
+            return export_func(df)
+        except PARQUET_ERRORS as exc:
+            # Fall back to CSV only for tables Arrow cannot represent
+            logger.warning("Parquet export of %s failed (%s); exporting CSV instead", name, exc)
+            return export_to_csv(df)
+
+    return export_tables(_data, export_table)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_csv_export_size(_data: dict[str, pd.DataFrame], data_key: tuple) -> float:
+    """
+    Calculate the total CSV export size in MB, cached per dataset.
 
-    return downloads
+    Only the size is cached, so showing the CSV comparison in Parquet mode
+    does not keep a second copy of every table's bytes.
+
+    Args:
+        _data: HR data dictionary
+        data_key: Hashable key identifying _data (data version and filters)
+
+    Returns:
+        Total size in MB
+    """
+    return get_total_export_size(export_tables(_data, lambda name, df: export_to_csv(df)))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_zip_download(_data: dict[str, pd.DataFrame], data_key: tuple, format: str = "csv") -> bytes:
+    """
+    Bundle all tables into a ZIP file, cached per dataset and format.
+
+    Args:
+        _data: HR data dictionary
+        data_key: Hashable key identifying _data (data version and filters)
+        format: Export format ("csv" or "parquet")
+
+    Returns:
+        ZIP file as bytes
+    """
+    return zip_exported_files(get_download_data(_data, data_key, format), format)
 
 
-def render_download_buttons(data: dict[str, pd.DataFrame]) -> None:
+def render_download_buttons(data: dict[str, pd.DataFrame], data_key: tuple) -> None:
     """
     Render download buttons for data export.
 
     Args:
         data: HR data dictionary
+        data_key: Hashable key identifying data, used to cache the exports
     """
     st.sidebar.divider()
     st.sidebar.subheader("Export Data")
@@ -344,20 +395,21 @@ def render_download_buttons(data: dict[str, pd.DataFrame]) -> None:
 
     export_format = "parquet" if "Parquet" in selected_format else "csv"
 
-    # Show size comparison
-    csv_size = get_total_export_size(data, "csv")
+    # Show size comparison, measured on the (cached) export bytes
+    downloads = get_download_data(data, data_key, export_format)
     if PARQUET_AVAILABLE and export_format == "parquet":
-        parquet_size = get_total_export_size(data, "parquet")
+        parquet_size = get_total_export_size(downloads)
+        csv_size = get_csv_export_size(data, data_key)
         savings = ((csv_size - parquet_size) / csv_size) * 100 if csv_size > 0 else 0
         st.sidebar.caption(
             f"Parquet: {parquet_size:.1f} MB vs CSV: {csv_size:.1f} MB ({savings:.0f}% smaller)"
         )
     else:
-        st.sidebar.caption(f"Total size: {csv_size:.1f} MB")
+        st.sidebar.caption(f"Total size: {get_total_export_size(downloads):.1f} MB")
 
     # Download All button
     extension = "csv" if export_format == "csv" else "parquet"
-    zip_data = create_zip_download(data, export_format)
+    zip_data = get_zip_download(data, data_key, export_format)
 
     st.sidebar.download_button(
         label=f"Download All ({extension.upper()})",
@@ -370,7 +422,6 @@ def render_download_buttons(data: dict[str, pd.DataFrame]) -> None:
 
     # Individual table downloads (collapsed)
     with st.sidebar.expander("Individual Tables"):
-        downloads = get_download_data(data, export_format)
         mime_type = "text/csv" if export_format == "csv" else "application/octet-stream"
 
         for name, file_bytes in downloads.items():
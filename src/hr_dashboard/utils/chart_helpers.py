@@ -1,5 +1,6 @@
 """Chart helper utilities."""
 
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
@@ -29,6 +30,21 @@ SENIORITY_COLORS = {
     5: "#085294",  # Dark blue
 }
 
+SENIORITY_LABELS = {
+    1: "1-Entry",
+    2: "2-Junior",
+    3: "3-Mid",
+    4: "4-Senior",
+    5: "5-Executive",
+}
+
+SENIORITY_LABEL_COLORS = {SENIORITY_LABELS[k]: v for k, v in SENIORITY_COLORS.items()}
+
+# Labels indexed by seniority level (None for unknown levels), for gathering
+# labels with one array lookup instead of a dict lookup per row
+_SENIORITY_LABEL_ARRAY = np.full(max(SENIORITY_LABELS) + 1, None, dtype=object)
+_SENIORITY_LABEL_ARRAY[list(SENIORITY_LABELS)] = list(SENIORITY_LABELS.values())
+
 GENDER_COLORS = {
     "male": "#0A6ED1",    # SAP Blue
     "female": "#E9730C",  # SAP Gold
@@ -57,12 +73,85 @@ CHART_BGCOLOR = "#FFFFFF"
 CHART_PAPER_BGCOLOR = "#FFFFFF"
 CHART_FONT_COLOR = "#32363A"
 
+# Plotly config for small summary charts without hover/zoom interactions
+STATIC_CHART_CONFIG = {"staticPlot": True, "displayModeBar": False}
+
 
 def format_currency(value: float) -> str:
     """Format value as currency."""
     return f"${value:,.0f}"
 
 
+def label_seniority_levels(levels: pd.Series) -> np.ndarray:
+    """
+    Map seniority levels to their display labels.
+
+    Args:
+        levels: Seniority levels (numeric or categorical, may contain missing values)
+
+    Returns:
+        Object array of labels, None where the level is missing or unknown
+    """
+    values = np.asarray(levels, dtype=float)
+    known = (values >= 0) & (values < len(_SENIORITY_LABEL_ARRAY))
+    return _SENIORITY_LABEL_ARRAY[np.where(known, values, 0).astype(np.intp)]
+
+
+def count_by(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Count rows per value of a column for charting.
+
+    Uses value_counts (a direct hash count) rather than a groupby; unobserved
+    categories are dropped and rows are ordered by value, matching
+    ``df.groupby(column, observed=True).size()``.
+
+    Args:
+        df: Source DataFrame
+        column: Column to count values of
+
+    Returns:
+        DataFrame with the column and a "count" column
+    """
+    values = df[column]
+    counts = values.value_counts(sort=False)
+    counts = counts[counts > 0]
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        # Categorical counts already come out in category order
+        counts = counts.sort_index()
+    return counts.reset_index(name="count")
+
+
+def frame_fingerprint(df: pd.DataFrame, columns: list[str]) -> int:
+    """
+    Compute a content hash of selected columns, for keying cached figures.
+
+    Args:
+        df: Source DataFrame
+        columns: Columns the figure is built from
+
+    Returns:
+        Integer fingerprint (equal for equal column contents)
+    """
+    return int(pd.util.hash_pandas_object(df[columns], index=False).sum())
+
+
+def _category_colors(categories, color_discrete_map: dict | None) -> list[str]:
+    """
+    Resolve one color per category the way Plotly Express does.
+
+    Args:
+        categories: Category values in display order
+        color_discrete_map: Color mapping dictionary (may be None)
+
+    Returns:
+        List of colors; unmapped categories take the default qualitative
+        sequence by position
+    """
+    mapping = color_discrete_map or {}
+    sequence = px.colors.qualitative.Plotly
+    return [mapping.get(category, sequence[i % len(sequence)]) for i, category in enumerate(categories)]
+
+
 def create_kpi_card(label: str, value: str | float, delta: str | None = None) -> dict:
     """
     Create KPI card data.
@@ -91,6 +180,9 @@ def create_bar_chart(
     """
     Create a styled bar chart.
 
+    Bars colored by their own category (or not at all) are built directly with
+    go.Bar, one trace per category, skipping Plotly Express's frame handling.
+
     Args:
         df: DataFrame with data
         x: X-axis column
@@ -104,16 +196,44 @@ def create_bar_chart(
     Returns:
         Plotly Figure
     """
-    fig = px.bar(
-        df,
-        x=x,
-        y=y,
-        title=title,
-        color=color,
-        color_discrete_map=color_discrete_map,
-        orientation=orientation,
-        text_auto=text_auto,
-    )
+    category = x if orientation == "v" else y
+    if color in (None, category):
+        fig = go.Figure()
+        bar_style = dict(
+            orientation=orientation,
+            hovertemplate=f"{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>",
+            texttemplate=("%{y}" if orientation == "v" else "%{x}") if text_auto else None,
+            textposition="auto",
+        )
+        x_values, y_values = df[x].to_numpy(), df[y].to_numpy()
+        if color is None:
+            fig.add_trace(go.Bar(x=x_values, y=y_values, **bar_style))
+        else:
+            keys = df[category].to_numpy()
+            categories = pd.unique(keys)
+            for value, bar_color in zip(categories, _category_colors(categories, color_discrete_map)):
+                rows = keys == value
+                fig.add_trace(
+                    go.Bar(
+                        x=x_values[rows],
+                        y=y_values[rows],
+                        name=str(value),
+                        marker_color=bar_color,
+                        **bar_style,
+                    )
+                )
+        fig.update_layout(title=title, xaxis_title=x, yaxis_title=y, legend_title=color, barmode="relative")
+    else:
+        fig = px.bar(
+            df,
+            x=x,
+            y=y,
+            title=title,
+            color=color,
+            color_discrete_map=color_discrete_map,
+            orientation=orientation,
+            text_auto=text_auto,
+        )
     fig.update_layout(
         showlegend=color is not None,
         plot_bgcolor=CHART_BGCOLOR,
@@ -146,15 +266,17 @@ def create_pie_chart(
     Returns:
         Plotly Figure
     """
-    fig = px.pie(
-        df,
-        values=values,
-        names=names,
-        title=title,
-        color=names,
-        color_discrete_map=color_discrete_map,
-        hole=hole,
+    labels = df[names].to_numpy()
+    fig = go.Figure(
+        go.Pie(
+            labels=labels,
+            values=df[values].to_numpy(),
+            hole=hole,
+            marker=dict(colors=_category_colors(labels, color_discrete_map)),
+            hovertemplate=f"{names}=%{{label}}<br>{values}=%{{value}}<extra></extra>",
+        )
     )
+    fig.update_layout(title=title)
     fig.update_traces(textposition="inside", textinfo="percent+label")
     fig.update_layout(
         paper_bgcolor=CHART_PAPER_BGCOLOR,
@@ -174,6 +296,9 @@ def create_histogram(
     """
     Create a styled histogram.
 
+    Uncolored histograms are binned here with np.histogram (equal-width bins
+    over the data range), so only the bin counts are sent to the browser.
+
     Args:
         df: DataFrame with data
         x: Column for histogram
@@ -184,13 +309,25 @@ def create_histogram(
     Returns:
         Plotly Figure
     """
-    fig = px.histogram(
-        df,
-        x=x,
-        title=title,
-        nbins=nbins,
-        color=color,
-    )
+    if color is None:
+        counts, edges = np.histogram(df[x].dropna().to_numpy(dtype=float), bins=nbins)
+        fig = go.Figure(
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                customdata=np.column_stack([edges[:-1], edges[1:]]),
+                hovertemplate="%{customdata[0]:,.0f} - %{customdata[1]:,.0f}<br>Count: %{y}<extra></extra>",
+            )
+        )
+        fig.update_layout(title=title, xaxis_title=x, yaxis_title="count")
+    else:
+        fig = px.histogram(
+            df,
+            x=x,
+            title=title,
+            nbins=nbins,
+            color=color,
+        )
     fig.update_layout(
         plot_bgcolor=CHART_BGCOLOR,
         paper_bgcolor=CHART_PAPER_BGCOLOR,
@@ -212,6 +349,10 @@ def create_box_plot(
     """
     Create a styled box plot.
 
+    When boxes are colored by their own category (or not at all), quartiles
+    and fences are computed here and only those plus the outliers are sent to
+    the browser, instead of every value.
+
     Args:
         df: DataFrame with data
         x: X-axis column (category)
@@ -223,14 +364,18 @@ def create_box_plot(
     Returns:
         Plotly Figure
     """
-    fig = px.box(
-        df,
-        x=x,
-        y=y,
-        title=title,
-        color=color,
-        color_discrete_map=color_discrete_map,
-    )
+    if color in (None, x):
+        fig = _precomputed_box_plot(df, x, y, color_discrete_map if color else None)
+        fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    else:
+        fig = px.box(
+            df,
+            x=x,
+            y=y,
+            title=title,
+            color=color,
+            color_discrete_map=color_discrete_map,
+        )
     fig.update_layout(
         plot_bgcolor=CHART_BGCOLOR,
         paper_bgcolor=CHART_PAPER_BGCOLOR,
@@ -240,11 +385,62 @@ def create_box_plot(
     return fig
 
 
+def _precomputed_box_plot(
+    df: pd.DataFrame, x: str, y: str, color_discrete_map: dict | None
+) -> go.Figure:
+    """Build one precomputed box (Tukey fences) plus an outlier trace per category."""
+    values = df[[x, y]].dropna()
+    if len(values) == 0:
+        return go.Figure()
+
+    stats = values.groupby(x, observed=True)[y].quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ["q1", "median", "q3"]
+    iqr = stats["q3"] - stats["q1"]
+    stats["low"] = stats["q1"] - 1.5 * iqr
+    stats["high"] = stats["q3"] + 1.5 * iqr
+
+    # Fences are the most extreme values within 1.5 IQR of the box
+    bounds = stats[["low", "high"]].reindex(values[x].to_numpy()).to_numpy()
+    inside = (values[y].to_numpy() >= bounds[:, 0]) & (values[y].to_numpy() <= bounds[:, 1])
+    fences = values[inside].groupby(x, observed=True)[y].agg(["min", "max"])
+    outliers = values[~inside].groupby(x, observed=True)[y]
+
+    colors = _category_colors(stats.index, color_discrete_map)
+    fig = go.Figure()
+    for color, (category, row) in zip(colors, stats.iterrows()):
+        fig.add_trace(
+            go.Box(
+                x=[category],
+                q1=[row["q1"]],
+                median=[row["median"]],
+                q3=[row["q3"]],
+                lowerfence=[fences.at[category, "min"]],
+                upperfence=[fences.at[category, "max"]],
+                name=str(category),
+                marker_color=color,
+            )
+        )
+        if category in outliers.groups:
+            points = outliers.get_group(category)
+            fig.add_trace(
+                go.Scatter(
+                    x=[category] * len(points),
+                    y=points.to_numpy(),
+                    mode="markers",
+                    name=str(category),
+                    marker=dict(color=color, size=4),
+                    showlegend=False,
+                    hovertemplate="%{y}<extra></extra>",
+                )
+            )
+    return fig
+
+
 def create_heatmap(
     df: pd.DataFrame,
     x: str,
     y: str,
-    z: str,
+    z: str | None,
     title: str,
     color_scale: str = "Blues",
 ) -> go.Figure:
@@ -252,10 +448,10 @@ def create_heatmap(
     Create a styled heatmap.
 
     Args:
-        df: DataFrame with data (should be pivoted or aggregated)
-        x: X-axis column
-        y: Y-axis column
-        z: Values column
+        df: Row-level DataFrame, or an already pivoted y-by-x matrix when z is None
+        x: X-axis column (ignored when z is None)
+        y: Y-axis column (ignored when z is None)
+        z: Values column averaged into each cell, or None if df is pivoted
         title: Chart title
         color_scale: Plotly color scale name
 
@@ -263,7 +459,17 @@ def create_heatmap(
         Plotly Figure
     """
     # Pivot if needed
-    pivot_df = df.pivot_table(values=z, index=y, columns=x, aggfunc="mean")
+    if z is None:
+        pivot_df = df
+    else:
+        # Same matrix as pivot_table(aggfunc="mean"), via the faster groupby path
+        pivot_df = (
+            df.groupby([y, x], observed=True)[z]
+            .mean()
+            .unstack(x)
+            .dropna(how="all")
+            .dropna(how="all", axis=1)
+        )
 
     fig = px.imshow(
         pivot_df,
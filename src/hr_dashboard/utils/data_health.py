@@ -1,11 +1,25 @@
 """Data health validation checks for HR data quality."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from datetime import date
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
+from hr_dashboard.utils.employee_tables import (
+    employee_id_lookup,
+    latest_per_employee,
+    rows_for_employees,
+)
+from hr_dashboard.utils.workforce import employment_dates, headcount_at
+
+# Checks run concurrently by run_health_checks (the checks only read the data)
+CHECK_WORKERS = min(6, os.cpu_count() or 1)
+
 
 @dataclass
 class HealthCheck:
@@ -22,6 +36,7 @@ def run_health_checks(
     start_year: int,
     end_year: int,
     include_hiring: bool = False,
+    current_assignments: dict[str, pd.DataFrame] | None = None,
 ) -> list[HealthCheck]:
     """
     Run all data health checks.
@@ -31,28 +46,43 @@ def run_health_checks(
         start_year: Simulation start year
         end_year: Simulation end year
         include_hiring: Whether hiring is enabled
+        current_assignments: Optional latest-row-per-employee snapshots keyed by
+            table name ("employee_job_assignment", "employee_org_assignment");
+            missing ones are computed from the full tables
 
     Returns:
         List of HealthCheck results
     """
-    checks = []
-
-    employees_df = data.get("employee", pd.DataFrame())
+    employees_df = data.get("employee")
 
-    if employees_df.empty:
+    if _is_missing(employees_df):
         return [HealthCheck("Data Available", "fail", "No employee data found")]
 
+    current_assignments = current_assignments or {}
+
     # Run all checks
-    checks.append(check_headcount_trend(employees_df, start_year, end_year))
-    checks.append(check_attrition_rate(employees_df, start_year, end_year))
-    checks.append(check_bu_distribution(data))
-    checks.append(check_seniority_pyramid(data))
-    checks.append(check_tenure_mix(employees_df))
+    tasks = [
+        partial(check_headcount_trend, employees_df, start_year, end_year),
+        partial(check_attrition_rate, employees_df, start_year, end_year),
+        partial(check_bu_distribution, data, current_assignments.get("employee_org_assignment")),
+        partial(check_seniority_pyramid, data, current_assignments.get("employee_job_assignment")),
+        partial(check_tenure_mix, employees_df),
+    ]
 
     if include_hiring:
-        checks.append(check_new_hire_seniority(data, start_year, end_year))
+        tasks.append(partial(check_new_hire_seniority, data, start_year, end_year))
 
-    return checks
+    if CHECK_WORKERS <= 1:
+        return [task() for task in tasks]
+
+    # Results come back in task order
+    with ThreadPoolExecutor(max_workers=CHECK_WORKERS) as executor:
+        return list(executor.map(lambda task: task(), tasks))
+
+
+def _is_missing(df: pd.DataFrame | None) -> bool:
+    """Whether a table is absent from the data dictionary or has no rows."""
+    return df is None or df.empty
 
 
 def check_headcount_trend(
@@ -61,18 +91,14 @@ def check_headcount_trend(
     """Check that headcount never goes negative."""
     name = "Headcount Trend"
 
-    for year in range(start_year, end_year + 1):
-        year_end = date(year, 12, 31)
+    hire_dates, termination_dates = employment_dates(employees_df)
 
-        headcount = employees_df[
-            (pd.to_datetime(employees_df["hire_date"]) <= pd.Timestamp(year_end))
-            & (
-                (employees_df.get("termination_date") is None)
-                | (employees_df["termination_date"].isna())
-                | (pd.to_datetime(employees_df["termination_date"]) > pd.Timestamp(year_end))
-            )
-        ].shape[0]
+    # Headcount at each year end (hire <= year end < termination)
+    years = range(start_year, end_year + 1)
+    year_ends = pd.to_datetime([date(year, 12, 31) for year in years]).to_numpy()
+    headcounts = headcount_at(hire_dates, termination_dates, year_ends, side="right")
 
+    for year, headcount in zip(years, headcounts):
         if headcount < 0:
             return HealthCheck(
                 name, "fail", f"Negative headcount in {year}",
@@ -97,31 +123,23 @@ def check_attrition_rate(
     if "termination_date" not in employees_df.columns:
         return HealthCheck(name, "pass", "No attrition data (disabled)")
 
-    rates = []
-    for year in range(start_year, end_year + 1):
-        year_start = date(year, 1, 1)
-        year_end = date(year, 12, 31)
-
-        # Employees active at start of year
-        active_start = employees_df[
-            (pd.to_datetime(employees_df["hire_date"]) < pd.Timestamp(year_start))
-            & (
-                (employees_df["termination_date"].isna())
-                | (pd.to_datetime(employees_df["termination_date"]) >= pd.Timestamp(year_start))
-            )
-        ].shape[0]
-
-        if active_start == 0:
-            continue
-
-        # Terminations during the year
-        terminations = employees_df[
-            (employees_df["termination_date"].notna())
-            & (pd.to_datetime(employees_df["termination_date"]).dt.year == year)
-        ].shape[0]
-
-        rate = terminations / active_start
-        rates.append((year, rate))
+    hire_dates, termination_dates = employment_dates(employees_df)
+    sorted_terminations = np.sort(termination_dates[~np.isnat(termination_dates)])
+
+    # Year boundaries, including the start of the year after end_year; active at
+    # a year start means hire < year start <= termination
+    years = range(start_year, end_year + 1)
+    boundaries = pd.to_datetime(
+        [date(year, 1, 1) for year in range(start_year, end_year + 2)]
+    ).to_numpy()
+    active_starts = headcount_at(hire_dates, termination_dates, boundaries[:-1], side="left")
+    terminations = np.diff(np.searchsorted(sorted_terminations, boundaries, side="left"))
+
+    rates = [
+        (year, terminated / active_start)
+        for year, active_start, terminated in zip(years, active_starts, terminations)
+        if active_start > 0
+    ]
 
     if not rates:
         return HealthCheck(name, "pass", "No attrition data available")
@@ -148,28 +166,29 @@ def check_attrition_rate(
     return HealthCheck(name, "pass", f"Avg rate: {avg_rate:.1%}")
 
 
-def check_bu_distribution(data: dict[str, pd.DataFrame]) -> HealthCheck:
+def check_bu_distribution(
+    data: dict[str, pd.DataFrame], current_orgs: pd.DataFrame | None = None
+) -> HealthCheck:
     """Check that all business units have >5% representation."""
     name = "BU Distribution"
 
-    org_assignments = data.get("employee_org_assignment", pd.DataFrame())
+    org_assignments = data.get("employee_org_assignment")
 
-    if org_assignments.empty:
+    if _is_missing(org_assignments):
         return HealthCheck(name, "warning", "Org data not available")
 
     # Get current org assignments (business_unit is already in org_assignments)
-    current_orgs = org_assignments.sort_values("start_date", ascending=False).drop_duplicates(
-        "employee_id", keep="first"
-    )
+    if current_orgs is None:
+        current_orgs = latest_per_employee(org_assignments)
 
     # Check if business_unit column exists
     if "business_unit" not in current_orgs.columns:
         # Try to merge with org_units if business_unit not in assignments
-        org_units = data.get("organization_unit", pd.DataFrame())
-        if org_units.empty or "org_id" not in current_orgs.columns:
+        org_units = data.get("organization_unit")
+        if _is_missing(org_units) or "org_id" not in current_orgs.columns:
             return HealthCheck(name, "warning", "Business unit data not available")
         current_orgs = current_orgs.merge(
-            org_units[["org_id", "business_unit"]], on="org_id", how="left"
+            org_units[["org_id", "business_unit"]], on="org_id", how="left", validate="m:1"
         )
 
     # Calculate distribution
@@ -178,6 +197,7 @@ def check_bu_distribution(data: dict[str, pd.DataFrame]) -> HealthCheck:
         return HealthCheck(name, "warning", "No org assignments found")
 
     bu_counts = current_orgs["business_unit"].value_counts()
+    bu_counts = bu_counts[bu_counts > 0]
     bu_pcts = bu_counts / total
 
     low_bus = bu_pcts[bu_pcts < 0.05].index.tolist()
@@ -192,32 +212,34 @@ def check_bu_distribution(data: dict[str, pd.DataFrame]) -> HealthCheck:
     return HealthCheck(name, "pass", f"{len(bu_counts)} BUs well distributed")
 
 
-def check_seniority_pyramid(data: dict[str, pd.DataFrame]) -> HealthCheck:
+def check_seniority_pyramid(
+    data: dict[str, pd.DataFrame], current_jobs: pd.DataFrame | None = None
+) -> HealthCheck:
     """Check seniority follows pyramid structure (more junior than senior)."""
     name = "Seniority Pyramid"
 
-    job_assignments = data.get("employee_job_assignment", pd.DataFrame())
-    job_roles = data.get("job_role", pd.DataFrame())
+    job_assignments = data.get("employee_job_assignment")
+    job_roles = data.get("job_role")
 
-    if job_assignments.empty or job_roles.empty:
+    if _is_missing(job_assignments) or _is_missing(job_roles):
         return HealthCheck(name, "warning", "Job data not available")
 
     # Get current job assignments
-    current_jobs = job_assignments.sort_values("start_date", ascending=False).drop_duplicates(
-        "employee_id", keep="first"
-    )
+    if current_jobs is None:
+        current_jobs = latest_per_employee(job_assignments)
 
     # Get seniority levels
     if "seniority_level" not in current_jobs.columns:
         current_jobs = current_jobs.merge(
-            job_roles[["job_id", "seniority_level"]], on="job_id", how="left"
+            job_roles[["job_id", "seniority_level"]], on="job_id", how="left", validate="m:1"
         )
 
-    seniority_counts = current_jobs["seniority_level"].value_counts().sort_index()
+    levels = current_jobs["seniority_level"].to_numpy()
 
-    # Check pyramid: L1-L2 should be more than L4-L5
-    junior = seniority_counts.get(1, 0) + seniority_counts.get(2, 0)
-    senior = seniority_counts.get(4, 0) + seniority_counts.get(5, 0)
+    # Check pyramid: L1-L2 should be more than L4-L5 (levels are integers 1-5;
+    # range comparisons avoid building a hash table of counts)
+    junior = int(((levels >= 1) & (levels <= 2)).sum())
+    senior = int(((levels >= 4) & (levels <= 5)).sum())
 
     if junior < senior:
         return HealthCheck(
@@ -233,19 +255,17 @@ def check_tenure_mix(employees_df: pd.DataFrame) -> HealthCheck:
     """Check for healthy tenure mix (both new and tenured employees)."""
     name = "Tenure Mix"
 
-    if employees_df.empty:
+    if _is_missing(employees_df):
         return HealthCheck(name, "warning", "No employees")
 
     today = date.today()
-    employees_df = employees_df.copy()
 
-    # Calculate tenure
-    employees_df["tenure_years"] = employees_df["hire_date"].apply(
-        lambda x: (today - x).days / 365.25 if pd.notna(x) else 0
-    )
+    # Calculate tenure (missing hire dates count as zero tenure)
+    hire_dates = pd.to_datetime(employees_df["hire_date"])
+    tenure_years = (pd.Timestamp(today) - hire_dates).dt.days.fillna(0).to_numpy() / 365.25
 
-    new_hires = (employees_df["tenure_years"] < 2).sum()
-    tenured = (employees_df["tenure_years"] > 5).sum()
+    new_hires = (tenure_years < 2).sum()
+    tenured = (tenure_years > 5).sum()
     total = len(employees_df)
 
     if new_hires == 0:
@@ -277,11 +297,11 @@ def check_new_hire_seniority(
     """Check that >50% of new hires are L1-L2 (junior)."""
     name = "New Hire Seniority"
 
-    employees_df = data.get("employee", pd.DataFrame())
-    job_assignments = data.get("employee_job_assignment", pd.DataFrame())
-    job_roles = data.get("job_role", pd.DataFrame())
+    employees_df = data.get("employee")
+    job_assignments = data.get("employee_job_assignment")
+    job_roles = data.get("job_role")
 
-    if employees_df.empty or job_assignments.empty:
+    if _is_missing(employees_df) or _is_missing(job_assignments):
         return HealthCheck(name, "warning", "Data not available")
 
     # Find employees hired during simulation
@@ -292,10 +312,13 @@ def check_new_hire_seniority(
     if new_hires.empty:
         return HealthCheck(name, "pass", "No new hires to check")
 
-    # Get their first job assignments
-    new_hire_jobs = job_assignments[
-        job_assignments["employee_id"].isin(new_hires["employee_id"])
-    ].sort_values("start_date").drop_duplicates("employee_id", keep="first")
+    # Get their first job assignments (dense integer IDs use a direct lookup table)
+    new_hire_ids = new_hires["employee_id"].to_numpy()
+    lookup = employee_id_lookup(employees_df["employee_id"].to_numpy(), new_hire_ids)
+    new_hire_jobs = rows_for_employees(job_assignments, new_hire_ids, lookup)
+    new_hire_jobs = new_hire_jobs.loc[
+        new_hire_jobs.groupby("employee_id", sort=False)["start_date"].idxmin()
+    ]
 
     if new_hire_jobs.empty:
         return HealthCheck(name, "warning", "No job data for new hires")
@@ -303,11 +326,12 @@ def check_new_hire_seniority(
     # Get seniority levels
     if "seniority_level" not in new_hire_jobs.columns:
         new_hire_jobs = new_hire_jobs.merge(
-            job_roles[["job_id", "seniority_level"]], on="job_id", how="left"
+            job_roles[["job_id", "seniority_level"]], on="job_id", how="left", validate="m:1"
         )
 
     total = len(new_hire_jobs)
-    junior = new_hire_jobs["seniority_level"].isin([1, 2]).sum()
+    levels = new_hire_jobs["seniority_level"].to_numpy()
+    junior = int(((levels >= 1) & (levels <= 2)).sum())
     junior_pct = junior / total * 100 if total > 0 else 0
 
     if junior_pct < 50:
@@ -0,0 +1,155 @@
+"""On-disk Parquet cache for generated HR datasets."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from hr_dashboard.utils.export import PARQUET_AVAILABLE
+
+# Cache location (override with HR_DASHBOARD_CACHE_DIR)
+CACHE_DIR = Path(os.environ.get("HR_DASHBOARD_CACHE_DIR", Path.home() / ".cache" / "hr_dashboard"))
+
+# Maximum number of cached datasets kept on disk (least recently used are evicted)
+MAX_CACHE_ENTRIES = 8
+
+PARAMS_FILE = "params.json"
+
+
+def _generator_version() -> str:
+    """Installed hr-data-generator version, so upgrades invalidate cached datasets."""
+    try:
+        return metadata.version("hr-data-generator")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+GENERATOR_VERSION = _generator_version()
+
+
+def get_cache_key(params: dict[str, Any]) -> str:
+    """
+    Compute a stable cache key for a set of generation parameters.
+
+    The installed hr-data-generator version is part of the key, since the
+    same seed can produce different data after a generator upgrade.
+
+    Args:
+        params: Keyword arguments passed to generate_hr_data
+
+    Returns:
+        Hex digest identifying the parameter set and generator version
+    """
+    payload = json.dumps(
+        {"params": params, "generator_version": GENERATOR_VERSION}, sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def load_cached_dataset(
+    params: dict[str, Any], cache_dir: Path | None = None
+) -> dict[str, pd.DataFrame] | None:
+    """
+    Load a previously generated dataset from disk.
+
+    Args:
+        params: Generation parameters identifying the dataset
+        cache_dir: Cache directory (defaults to CACHE_DIR)
+
+    Returns:
+        Dictionary of DataFrames, or None if not cached or unreadable
+        (including entries evicted by another session while loading)
+    """
+    if not PARQUET_AVAILABLE:
+        return None
+
+    entry_dir = (cache_dir or CACHE_DIR) / get_cache_key(params)
+    if not (entry_dir / PARAMS_FILE).exists():
+        return None
+
+    try:
+        data = {
+            path.stem: pd.read_parquet(path, engine="pyarrow")
+            for path in sorted(entry_dir.glob("*.parquet"))
+        }
+    except Exception:
+        # Corrupt or incompatible entry: treat as a cache miss
+        return None
+
+    if not data:
+        # Evicted between the existence check and the glob
+        return None
+
+    # Mark as recently used for eviction
+    try:
+        os.utime(entry_dir / PARAMS_FILE)
+    except OSError:
+        pass
+    return data
+
+
+def save_cached_dataset(
+    params: dict[str, Any],
+    data: dict[str, pd.DataFrame],
+    cache_dir: Path | None = None,
+) -> None:
+    """
+    Write a generated dataset to disk, one Parquet file per table.
+
+    The entry is written to a temporary directory and moved into place, so
+    concurrent sessions never observe a partially written dataset. Failures
+    are ignored: the cache is an optimization only.
+
+    Args:
+        params: Generation parameters identifying the dataset
+        data: Dictionary of table names to DataFrames
+        cache_dir: Cache directory (defaults to CACHE_DIR)
+    """
+    if not PARQUET_AVAILABLE:
+        return
+
+    cache_dir = cache_dir or CACHE_DIR
+    entry_dir = cache_dir / get_cache_key(params)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=cache_dir, prefix=".tmp-"))
+    except OSError:
+        return
+
+    try:
+        for name, df in data.items():
+            df.to_parquet(tmp_dir / f"{name}.parquet", index=False, engine="pyarrow", compression="zstd")
+        (tmp_dir / PARAMS_FILE).write_text(json.dumps(params, sort_keys=True, default=str))
+        os.replace(tmp_dir, entry_dir)
+    except Exception:
+        # Unserializable table, or another session wrote the same entry first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return
+
+    _evict_old_entries(cache_dir)
+
+
+def _evict_old_entries(cache_dir: Path) -> None:
+    """Remove least recently used datasets beyond MAX_CACHE_ENTRIES."""
+    entries = []
+    try:
+        for entry_dir in cache_dir.iterdir():
+            try:
+                entries.append((entry_dir, (entry_dir / PARAMS_FILE).stat().st_mtime))
+            except OSError:
+                # Not a dataset, or removed by another session meanwhile
+                continue
+    except OSError:
+        return
+
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+
+    for entry_dir, _ in entries[MAX_CACHE_ENTRIES:]:
+        shutil.rmtree(entry_dir, ignore_errors=True)
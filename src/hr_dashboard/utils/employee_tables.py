@@ -0,0 +1,79 @@
+"""Row selection helpers for tables keyed by employee ID."""
+
+import numpy as np
+import pandas as pd
+
+# Default groupby options: skip unobserved categories and output key sorting
+GROUPBY_OPTIONS = {"sort": False, "observed": True}
+
+
+def employee_id_lookup(all_ids: np.ndarray, selected_ids: np.ndarray) -> np.ndarray | None:
+    """
+    Build a boolean lookup table indexed directly by employee ID.
+
+    Only possible when IDs are dense non-negative integers; the table is
+    built once per filter call and shared by every table.
+
+    Args:
+        all_ids: All employee IDs in the dataset
+        selected_ids: Employee IDs to keep
+
+    Returns:
+        Boolean array where lookup[employee_id] marks selected employees,
+        or None if the IDs are not suitable
+    """
+    if len(all_ids) == 0 or all_ids.dtype.kind not in "iu":
+        return None
+    if all_ids.min() < 0 or all_ids.max() > 4 * len(all_ids) + 1024:
+        return None
+
+    lookup = np.zeros(int(all_ids.max()) + 1, dtype=bool)
+    lookup[selected_ids] = True
+    return lookup
+
+
+def rows_for_employees(
+    df: pd.DataFrame, employee_ids: np.ndarray, lookup: np.ndarray | None = None
+) -> pd.DataFrame:
+    """
+    Select rows belonging to the given employees.
+
+    Dense integer IDs are resolved with a single gather from the lookup
+    table (see employee_id_lookup); other ID types fall back to pandas'
+    hash-based ``isin``, since ``np.isin`` on object arrays is orders of
+    magnitude slower.
+
+    Args:
+        df: DataFrame with an employee_id column
+        employee_ids: Sorted, unique employee IDs to keep
+        lookup: Optional boolean lookup table indexed by employee ID
+
+    Returns:
+        Rows of df whose employee_id is in employee_ids
+    """
+    column = df["employee_id"]
+    if lookup is not None:
+        values = column.to_numpy()
+        if values.dtype.kind in "iu" and (
+            len(values) == 0 or (values.min() >= 0 and values.max() < len(lookup))
+        ):
+            return df[lookup[values]]
+    return df[column.isin(employee_ids)]
+
+
+def latest_per_employee(df: pd.DataFrame, date_col: str = "start_date") -> pd.DataFrame:
+    """
+    Select the most recent row per employee from a time-variant table.
+
+    Uses groupby-idxmax rather than a full sort + drop_duplicates over the
+    entire history.
+
+    Args:
+        df: Time-variant DataFrame with an employee_id column
+        date_col: Column used to determine recency
+
+    Returns:
+        DataFrame with one row per employee
+    """
+    latest_idx = df.groupby("employee_id", **GROUPBY_OPTIONS)[date_col].idxmax()
+    return df.loc[latest_idx]
@@ -0,0 +1,58 @@
+"""Vectorized headcount helpers over employee hire and termination dates."""
+
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+
+def employment_dates(employees_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert hire and termination dates to datetime64 arrays.
+
+    Args:
+        employees_df: Employee DataFrame (termination_date may be absent)
+
+    Returns:
+        Tuple of (hire_dates, termination_dates), NaT where missing
+    """
+    hire_dates = pd.to_datetime(employees_df["hire_date"]).to_numpy()
+    if "termination_date" in employees_df.columns:
+        termination_dates = pd.to_datetime(employees_df["termination_date"]).to_numpy()
+    else:
+        termination_dates = np.full(len(hire_dates), np.datetime64("NaT"), dtype=hire_dates.dtype)
+    return hire_dates, termination_dates
+
+
+def headcount_at(
+    hire_dates: np.ndarray,
+    termination_dates: np.ndarray,
+    boundaries: np.ndarray,
+    side: Literal["left", "right"] = "right",
+) -> np.ndarray:
+    """
+    Count employees active at each boundary date.
+
+    With side="right" an employee counts when hire <= boundary < termination
+    (e.g. headcount at year end); with side="left" when hire < boundary <=
+    termination (e.g. active at year start). Leaving at the later of hire and
+    termination turns either into "hired by" minus "left by", i.e. two binary
+    searches per boundary over sorted date arrays.
+
+    Args:
+        hire_dates: datetime64 hire dates (NaT employees are never counted)
+        termination_dates: datetime64 termination dates (NaT while employed)
+        boundaries: datetime64 boundary dates
+        side: Which side of a boundary a hire/termination on that date falls
+
+    Returns:
+        Integer array of headcounts, one per boundary
+    """
+    hired = ~np.isnat(hire_dates)
+    left_dates = np.maximum(hire_dates[hired], termination_dates[hired])
+    sorted_hires = np.sort(hire_dates[hired])
+    sorted_leaves = np.sort(left_dates[~np.isnat(left_dates)])
+    return (
+        np.searchsorted(sorted_hires, boundaries, side=side)
+        - np.searchsorted(sorted_leaves, boundaries, side=side)
+    )
@@ -1,5 +1,6 @@
 """Attrition and Workforce Dynamics page with turnover analysis and visualizations."""
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
@@ -8,17 +9,29 @@ from datetime import date
 from hr_dashboard.data_manager import enrich_employee_data
 from hr_dashboard.utils.chart_helpers import (
     BU_COLORS,
-    SENIORITY_COLORS,
+    SENIORITY_LABEL_COLORS,
     ATTRITION_COLORS,
     TERMINATION_REASON_COLORS,
     COLORS,
+    count_by,
+    label_seniority_levels,
     create_bar_chart,
     create_pie_chart,
     create_line_chart,
+    frame_fingerprint,
     CHART_BGCOLOR,
     CHART_PAPER_BGCOLOR,
     CHART_FONT_COLOR,
+    STATIC_CHART_CONFIG,
 )
+from hr_dashboard.utils.workforce import employment_dates, headcount_at
+
+# Employment statuses counted as attrition
+ATTRITION_STATUSES = ["Terminated", "Retired"]
+
+# Tenure bucket edges in years (each bucket includes its lower edge) and labels
+TENURE_BINS = [-np.inf, 1, 2, 5, 10, np.inf]
+TENURE_BUCKETS = ["<1 year", "1-2 years", "2-5 years", "5-10 years", "10+ years"]
 
 
 def render(
@@ -49,11 +62,12 @@ def render(
 
     enriched_df = enrich_employee_data(data)
 
-    # Check if there are any terminated/retired employees
-    status_counts = employees_df["employment_status"].value_counts()
-    has_attrition = any(
-        status in status_counts.index for status in ["Terminated", "Retired"]
-    )
+    # Parse the employment dates once; the charts below use the .dt accessors
+    employees_df = _parse_employment_dates(employees_df)
+
+    # Check if there are any terminated/retired employees (value_counts of the
+    # categorical status column would also list statuses with zero employees)
+    has_attrition = employees_df["employment_status"].isin(ATTRITION_STATUSES).any()
 
     # Show workforce dynamics section if hiring is enabled
     if include_hiring:
@@ -72,6 +86,9 @@ def render(
         render_kpis(enriched_df, employees_df)
         st.divider()
 
+    # Aggregate all attrition breakdowns up front
+    breakdowns = compute_attrition_breakdowns(enriched_df, data)
+
     # Charts row 1
     col1, col2 = st.columns(2)
 
@@ -79,27 +96,45 @@ def render(
         render_termination_reasons(employees_df)
 
     with col2:
-        render_attrition_by_business_unit(enriched_df)
+        render_attrition_by_business_unit(breakdowns.get("business_unit"))
 
     # Charts row 2
     col3, col4 = st.columns(2)
 
     with col3:
-        render_attrition_by_performance(enriched_df, data)
+        render_attrition_by_performance(breakdowns.get("rating"))
 
     with col4:
-        render_attrition_by_tenure(enriched_df)
+        render_attrition_by_tenure(breakdowns.get("tenure_bucket"))
 
     # Charts row 3
     col5, col6 = st.columns(2)
 
     with col5:
-        render_attrition_by_seniority(enriched_df)
+        render_attrition_by_seniority(breakdowns.get("seniority_level"))
 
     with col6:
         render_attrition_timeline(employees_df)
 
 
+def _parse_employment_dates(employees_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the hire and termination date columns to datetime64.
+
+    Args:
+        employees_df: Employee DataFrame (not modified)
+
+    Returns:
+        DataFrame with parsed date columns (employees_df itself if already parsed)
+    """
+    parsed = {
+        col: pd.to_datetime(employees_df[col])
+        for col in ("hire_date", "termination_date")
+        if col in employees_df.columns and not pd.api.types.is_datetime64_any_dtype(employees_df[col])
+    }
+    return employees_df.assign(**parsed) if parsed else employees_df
+
+
 def render_workforce_dynamics(
     employees_df: pd.DataFrame,
     enriched_df: pd.DataFrame,
@@ -115,8 +150,11 @@ def render_workforce_dynamics(
     if end_year is None:
         end_year = date.today().year
 
-    # Calculate yearly metrics
-    yearly_data = calculate_yearly_workforce_metrics(employees_df, start_year, end_year)
+    # Calculate yearly metrics (cached per hire/termination dates and year range)
+    date_columns = [c for c in ("hire_date", "termination_date") if c in employees_df.columns]
+    yearly_data = _cached_yearly_workforce_metrics(
+        employees_df, frame_fingerprint(employees_df, date_columns), start_year, end_year
+    )
 
     if yearly_data.empty:
         st.info("No hiring or attrition data available for the selected period.")
@@ -151,57 +189,52 @@ def render_workforce_dynamics(
     with col2:
         render_headcount_trend_chart(yearly_data)
 
-    # New hire demographics
+    # New hire demographics: employees hired in the simulation period, selected once
+    # from the parsed hire years and shared by both charts
+    new_hires = employees_df[employees_df["hire_date"].dt.year.to_numpy() >= start_year]
+
     col3, col4 = st.columns(2)
 
     with col3:
-        render_new_hire_seniority(employees_df, enriched_df, data, start_year, end_year)
+        render_new_hire_seniority(new_hires, data)
 
     with col4:
-        render_new_hire_business_unit(employees_df, enriched_df, data, start_year, end_year)
+        render_new_hire_business_unit(new_hires, data)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_yearly_workforce_metrics(
+    _employees_df: pd.DataFrame, fingerprint: int, start_year: int, end_year: int
+) -> pd.DataFrame:
+    """Calculate yearly workforce metrics, cached per date column contents and year range."""
+    return calculate_yearly_workforce_metrics(_employees_df, start_year, end_year)
 
 
 def calculate_yearly_workforce_metrics(
     employees_df: pd.DataFrame, start_year: int, end_year: int
 ) -> pd.DataFrame:
     """Calculate hires, attrition, and headcount by year."""
-    years = list(range(start_year, end_year + 1))
-    data = []
-
-    for year in years:
-        year_start = date(year, 1, 1)
-        year_end = date(year, 12, 31)
-
-        # Count hires in this year
-        hires = employees_df[
-            (pd.to_datetime(employees_df["hire_date"]).dt.year == year)
-        ].shape[0]
-
-        # Count attrition in this year
-        if "termination_date" in employees_df.columns:
-            attrition = employees_df[
-                (employees_df["termination_date"].notna())
-                & (pd.to_datetime(employees_df["termination_date"]).dt.year == year)
-            ].shape[0]
-        else:
-            attrition = 0
-
-        # Calculate headcount at year end
-        headcount = employees_df[
-            (pd.to_datetime(employees_df["hire_date"]) <= pd.Timestamp(year_end))
-            & (
-                (employees_df["termination_date"].isna())
-                | (pd.to_datetime(employees_df["termination_date"]) > pd.Timestamp(year_end))
-            )
-        ].shape[0]
-
-        data.append({
-            "year": year,
-            "hires": hires,
-            "attrition": attrition,
-            "net_change": hires - attrition,
-            "headcount": headcount,
-        })
+    years = np.arange(start_year, end_year + 1)
+    n_years = len(years)
+
+    # Parse the date columns once instead of once per year
+    hire_dates, termination_dates = employment_dates(employees_df)
+
+    # Count hires and terminations per year with one bincount each
+    hires = _count_by_year(hire_dates, start_year, n_years)
+    attrition = _count_by_year(termination_dates, start_year, n_years)
+
+    # Headcount at each year end (hire <= year end < termination)
+    year_ends = pd.to_datetime([date(year, 12, 31) for year in years]).to_numpy()
+    headcount = headcount_at(hire_dates, termination_dates, year_ends, side="right")
+
+    data = {
+        "year": years,
+        "hires": hires,
+        "attrition": attrition,
+        "net_change": hires - attrition,
+        "headcount": headcount,
+    }
 
     df = pd.DataFrame(data)
 
@@ -212,32 +245,58 @@ def calculate_yearly_workforce_metrics(
     return df
 
 
+def _count_by_year(dates: np.ndarray, start_year: int, n_years: int) -> np.ndarray:
+    """
+    Count dates per calendar year over a range of years.
+
+    Args:
+        dates: datetime64 array (NaT entries are ignored)
+        start_year: First year of the range
+        n_years: Number of years in the range
+
+    Returns:
+        Integer array of counts, one per year
+    """
+    offsets = dates.astype("datetime64[Y]").astype(np.int64) - (start_year - 1970)
+    offsets = offsets[~np.isnat(dates) & (offsets >= 0) & (offsets < n_years)]
+    return np.bincount(offsets, minlength=n_years)
+
+
 def render_hires_vs_attrition_chart(yearly_data: pd.DataFrame) -> None:
     """Render grouped bar chart comparing hires and attrition by year."""
+    fig = _hires_vs_attrition_figure(
+        yearly_data, frame_fingerprint(yearly_data, ["year", "hires", "attrition", "net_change"])
+    )
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _hires_vs_attrition_figure(_yearly_data: pd.DataFrame, fingerprint: int) -> go.Figure:
+    """Build the hires vs attrition chart, cached per yearly counts (do not mutate)."""
     fig = go.Figure()
 
     # Hires bars (green)
     fig.add_trace(go.Bar(
         name="Hires",
-        x=yearly_data["year"],
-        y=yearly_data["hires"],
+        x=_yearly_data["year"],
+        y=_yearly_data["hires"],
         marker_color=COLORS["success"],
-        text=yearly_data["hires"],
+        text=_yearly_data["hires"],
         textposition="auto",
     ))
 
     # Attrition bars (red)
     fig.add_trace(go.Bar(
         name="Attrition",
-        x=yearly_data["year"],
-        y=yearly_data["attrition"],
+        x=_yearly_data["year"],
+        y=_yearly_data["attrition"],
         marker_color=COLORS["error"],
-        text=yearly_data["attrition"],
+        text=_yearly_data["attrition"],
         textposition="auto",
     ))
 
     # Add net change annotations
-    for _, row in yearly_data.iterrows():
+    for _, row in _yearly_data.iterrows():
         net = int(row["net_change"])
         color = COLORS["success"] if net >= 0 else COLORS["error"]
         fig.add_annotation(
@@ -259,8 +318,7 @@ def render_hires_vs_attrition_chart(yearly_data: pd.DataFrame) -> None:
         margin=dict(l=40, r=40, t=60, b=40),
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
     )
-
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_headcount_trend_chart(yearly_data: pd.DataFrame) -> None:
@@ -280,13 +338,7 @@ def render_headcount_trend_chart(yearly_data: pd.DataFrame) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_new_hire_seniority(
-    employees_df: pd.DataFrame,
-    enriched_df: pd.DataFrame,
-    data: dict[str, pd.DataFrame],
-    start_year: int,
-    end_year: int,
-) -> None:
+def render_new_hire_seniority(new_hires: pd.DataFrame, data: dict[str, pd.DataFrame]) -> None:
     """Render new hire seniority distribution."""
     # Get job assignments
     job_assignments = data.get("employee_job_assignment", pd.DataFrame())
@@ -296,54 +348,33 @@ def render_new_hire_seniority(
         st.info("Job assignment data not available")
         return
 
-    # Find employees hired in the simulation period
-    new_hires = employees_df[
-        pd.to_datetime(employees_df["hire_date"]).dt.year >= start_year
-    ]
-
     if new_hires.empty:
         st.info("No new hires in the selected period")
         return
 
-    # Get their initial job assignments (closest to hire date)
-    new_hire_jobs = []
-    for _, emp in new_hires.iterrows():
-        emp_jobs = job_assignments[job_assignments["employee_id"] == emp["employee_id"]]
-        if not emp_jobs.empty:
-            # Get first job assignment
-            first_job = emp_jobs.sort_values("start_date").iloc[0]
-            new_hire_jobs.append(first_job)
+    # Get their initial job assignments (first job assignment per employee)
+    new_hire_jobs_df = (
+        job_assignments[job_assignments["employee_id"].isin(new_hires["employee_id"])]
+        .sort_values("start_date")
+        .drop_duplicates("employee_id", keep="first")
+    )
 
-    if not new_hire_jobs:
+    if new_hire_jobs_df.empty:
         st.info("No job assignment data for new hires")
         return
 
-    new_hire_jobs_df = pd.DataFrame(new_hire_jobs)
-
     # Merge with job roles to get seniority
     if "seniority_level" not in new_hire_jobs_df.columns:
         new_hire_jobs_df = new_hire_jobs_df.merge(
-            job_roles[["job_id", "seniority_level"]], on="job_id", how="left"
+            job_roles[["job_id", "seniority_level"]], on="job_id", how="left", validate="m:1"
         )
 
     # Count by seniority
-    seniority_counts = (
-        new_hire_jobs_df.groupby("seniority_level")
-        .size()
-        .reset_index(name="count")
-    )
+    seniority_counts = count_by(new_hire_jobs_df, "seniority_level")
     seniority_counts["seniority_level"] = seniority_counts["seniority_level"].astype(int)
 
     # Add labels
-    seniority_labels = {
-        1: "1-Entry",
-        2: "2-Junior",
-        3: "3-Mid",
-        4: "4-Senior",
-        5: "5-Executive",
-    }
-    seniority_counts["level_label"] = seniority_counts["seniority_level"].map(seniority_labels)
-    label_colors = {seniority_labels[k]: v for k, v in SENIORITY_COLORS.items()}
+    seniority_counts["level_label"] = label_seniority_levels(seniority_counts["seniority_level"])
 
     fig = create_bar_chart(
         seniority_counts,
@@ -351,19 +382,13 @@ def render_new_hire_seniority(
         y="count",
         title="New Hire Seniority Distribution",
         color="level_label",
-        color_discrete_map=label_colors,
+        color_discrete_map=SENIORITY_LABEL_COLORS,
     )
     fig.update_layout(showlegend=False, xaxis_title="Seniority Level", yaxis_title="Count")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
 
 
-def render_new_hire_business_unit(
-    employees_df: pd.DataFrame,
-    enriched_df: pd.DataFrame,
-    data: dict[str, pd.DataFrame],
-    start_year: int,
-    end_year: int,
-) -> None:
+def render_new_hire_business_unit(new_hires: pd.DataFrame, data: dict[str, pd.DataFrame]) -> None:
     """Render new hire business unit distribution."""
     org_assignments = data.get("employee_org_assignment", pd.DataFrame())
 
@@ -371,11 +396,6 @@ def render_new_hire_business_unit(
         st.info("Organization data not available")
         return
 
-    # Find employees hired in the simulation period
-    new_hires = employees_df[
-        pd.to_datetime(employees_df["hire_date"]).dt.year >= start_year
-    ]
-
     if new_hires.empty:
         st.info("No new hires in the selected period")
         return
@@ -398,11 +418,7 @@ def render_new_hire_business_unit(
         return
 
     # Count by business unit
-    bu_counts = (
-        first_orgs.groupby("business_unit")
-        .size()
-        .reset_index(name="count")
-    )
+    bu_counts = count_by(first_orgs, "business_unit")
 
     fig = create_bar_chart(
         bu_counts,
@@ -413,7 +429,7 @@ def render_new_hire_business_unit(
         color_discrete_map=BU_COLORS,
     )
     fig.update_layout(showlegend=False, xaxis_title="Business Unit", yaxis_title="Count")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
 
 
 def render_kpis(enriched_df: pd.DataFrame, employees_df: pd.DataFrame) -> None:
@@ -445,7 +461,7 @@ def render_kpis(enriched_df: pd.DataFrame, employees_df: pd.DataFrame) -> None:
     with col5:
         # Voluntary vs Involuntary
         if "termination_reason" in employees_df.columns:
-            termed_df = employees_df[employees_df["employment_status"].isin(["Terminated", "Retired"])]
+            termed_df = employees_df[employees_df["employment_status"].isin(ATTRITION_STATUSES)]
             if len(termed_df) > 0:
                 voluntary_reasons = [
                     "Resignation - Career Opportunity",
@@ -471,43 +487,105 @@ def render_termination_reasons(employees_df: pd.DataFrame) -> None:
 
     # Filter to only terminated/retired employees
     termed_df = employees_df[
-        employees_df["employment_status"].isin(["Terminated", "Retired"])
+        employees_df["employment_status"].isin(ATTRITION_STATUSES)
     ].copy()
 
     if len(termed_df) == 0:
         st.info("No terminations to display")
         return
 
-    reason_counts = (
-        termed_df.groupby("termination_reason")
-        .size()
-        .reset_index(name="count")
+    reason_counts = count_by(termed_df, "termination_reason")
+
+    fig = _termination_reasons_figure(
+        reason_counts, frame_fingerprint(reason_counts, ["termination_reason", "count"])
     )
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
 
-    fig = create_pie_chart(
-        reason_counts,
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _termination_reasons_figure(_reason_counts: pd.DataFrame, fingerprint: int) -> go.Figure:
+    """Build the termination reasons pie chart, cached per reason counts (do not mutate)."""
+    return create_pie_chart(
+        _reason_counts,
         values="count",
         names="termination_reason",
         title="Termination Reasons",
         color_discrete_map=TERMINATION_REASON_COLORS,
     )
-    st.plotly_chart(fig, use_container_width=True)
 
 
-def render_attrition_by_business_unit(enriched_df: pd.DataFrame) -> None:
+def compute_attrition_breakdowns(
+    enriched_df: pd.DataFrame, data: dict[str, pd.DataFrame]
+) -> dict[str, pd.DataFrame]:
+    """
+    Aggregate attrition by business unit, performance rating, tenure and seniority.
+
+    The attrition flag is computed once and shared by every breakdown, so
+    the four charts do not each rescan the enriched table.
+
+    Args:
+        enriched_df: Enriched employee DataFrame with an employment_status column
+        data: HR data dictionary (for performance ratings)
+
+    Returns:
+        Dictionary keyed by "business_unit", "rating", "tenure_bucket" and
+        "seniority_level" of DataFrames with the key column, total, attrition
+        and attrition_rate (percent); breakdowns whose source column is
+        missing are left out
+    """
+    flags = enriched_df[["employee_id"]].assign(
+        attrition=enriched_df["employment_status"].isin(ATTRITION_STATUSES).to_numpy()
+    )
+    keys = {}
+
+    if "business_unit" in enriched_df.columns:
+        keys["business_unit"] = enriched_df["business_unit"]
+
+    if "employee_performance" in data:
+        # Latest performance rating per employee (employees without one are dropped)
+        perf_df = data["employee_performance"]
+        latest_perf = perf_df.sort_values("review_period_year", ascending=False).drop_duplicates(
+            "employee_id", keep="first"
+        )
+        keys["rating"] = enriched_df["employee_id"].map(
+            latest_perf.set_index("employee_id")["rating"]
+        ).rename("rating")
+
+    if "hire_date" in enriched_df.columns:
+        # Bucket tenure in years with one vectorized cut (missing hire dates count as 0);
+        # the ordered categorical keeps the buckets in tenure order
+        hire_dates = pd.to_datetime(enriched_df["hire_date"])
+        tenure_days = (pd.Timestamp(date.today()) - hire_dates).dt.days
+        tenure_years = tenure_days.fillna(0).to_numpy() / 365.25
+        keys["tenure_bucket"] = pd.Series(
+            pd.cut(tenure_years, bins=TENURE_BINS, labels=TENURE_BUCKETS, right=False),
+            index=enriched_df.index,
+            name="tenure_bucket",
+        )
+
+    if "seniority_level" in enriched_df.columns:
+        keys["seniority_level"] = enriched_df["seniority_level"]
+
+    breakdowns = {}
+    for name, key in keys.items():
+        # Rows with a missing key are dropped by the groupby
+        stats = (
+            flags.groupby(key, observed=True)
+            .agg(total=("employee_id", "count"), attrition=("attrition", "sum"))
+            .reset_index()
+        )
+        stats["attrition_rate"] = stats["attrition"] / stats["total"] * 100
+        breakdowns[name] = stats
+
+    return breakdowns
+
+
+def render_attrition_by_business_unit(bu_stats: pd.DataFrame | None) -> None:
     """Render attrition rate by business unit bar chart."""
-    if "business_unit" not in enriched_df.columns or "employment_status" not in enriched_df.columns:
+    if bu_stats is None:
         st.info("Business unit or status data not available")
         return
 
-    # Calculate attrition rate by business unit
-    bu_stats = enriched_df.groupby("business_unit").agg(
-        total=("employee_id", "count"),
-        attrition=("employment_status", lambda x: (x.isin(["Terminated", "Retired"])).sum())
-    ).reset_index()
-
-    bu_stats["attrition_rate"] = bu_stats["attrition"] / bu_stats["total"] * 100
-
     fig = create_bar_chart(
         bu_stats,
         x="business_unit",
@@ -524,37 +602,17 @@ def render_attrition_by_business_unit(enriched_df: pd.DataFrame) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_attrition_by_performance(enriched_df: pd.DataFrame, data: dict[str, pd.DataFrame]) -> None:
+def render_attrition_by_performance(rating_stats: pd.DataFrame | None) -> None:
     """Render attrition rate by performance rating bar chart."""
-    if "employee_performance" not in data or "employment_status" not in enriched_df.columns:
+    if rating_stats is None:
         st.info("Performance or status data not available")
         return
 
-    perf_df = data["employee_performance"]
-
-    # Get latest performance rating per employee
-    latest_perf = perf_df.sort_values("review_period_year", ascending=False).drop_duplicates(
-        "employee_id", keep="first"
-    )[["employee_id", "rating"]]
-
-    # Merge with enriched data
-    perf_enriched = enriched_df.merge(latest_perf, on="employee_id", how="left")
-
-    # Filter out employees without ratings
-    perf_enriched = perf_enriched[perf_enriched["rating"].notna()]
-
-    if len(perf_enriched) == 0:
+    if len(rating_stats) == 0:
         st.info("No performance rating data available")
         return
 
-    # Calculate attrition rate by rating
-    rating_stats = perf_enriched.groupby("rating").agg(
-        total=("employee_id", "count"),
-        attrition=("employment_status", lambda x: (x.isin(["Terminated", "Retired"])).sum())
-    ).reset_index()
-
-    rating_stats["attrition_rate"] = rating_stats["attrition"] / rating_stats["total"] * 100
-    rating_stats["rating"] = rating_stats["rating"].astype(int)
+    rating_stats = rating_stats.astype({"rating": int})
 
     fig = create_bar_chart(
         rating_stats,
@@ -569,52 +627,12 @@ def render_attrition_by_performance(enriched_df: pd.DataFrame, data: dict[str, p
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_attrition_by_tenure(enriched_df: pd.DataFrame) -> None:
+def render_attrition_by_tenure(tenure_stats: pd.DataFrame | None) -> None:
     """Render attrition rate by tenure bucket bar chart."""
-    if "hire_date" not in enriched_df.columns or "employment_status" not in enriched_df.columns:
+    if tenure_stats is None:
         st.info("Hire date or status data not available")
         return
 
-    df = enriched_df.copy()
-    today = date.today()
-
-    # Calculate tenure in years
-    df["tenure_years"] = df["hire_date"].apply(
-        lambda x: (today - x).days / 365.25 if pd.notna(x) else 0
-    )
-
-    # Create tenure buckets
-    def tenure_bucket(years):
-        if years < 1:
-            return "<1 year"
-        elif years < 2:
-            return "1-2 years"
-        elif years < 5:
-            return "2-5 years"
-        elif years < 10:
-            return "5-10 years"
-        else:
-            return "10+ years"
-
-    df["tenure_bucket"] = df["tenure_years"].apply(tenure_bucket)
-
-    # Calculate attrition rate by tenure bucket
-    tenure_stats = df.groupby("tenure_bucket").agg(
-        total=("employee_id", "count"),
-        attrition=("employment_status", lambda x: (x.isin(["Terminated", "Retired"])).sum())
-    ).reset_index()
-
-    tenure_stats["attrition_rate"] = tenure_stats["attrition"] / tenure_stats["total"] * 100
-
-    # Order the buckets
-    bucket_order = ["<1 year", "1-2 years", "2-5 years", "5-10 years", "10+ years"]
-    tenure_stats["tenure_bucket"] = pd.Categorical(
-        tenure_stats["tenure_bucket"],
-        categories=bucket_order,
-        ordered=True
-    )
-    tenure_stats = tenure_stats.sort_values("tenure_bucket")
-
     fig = create_bar_chart(
         tenure_stats,
         x="tenure_bucket",
@@ -628,40 +646,20 @@ def render_attrition_by_tenure(enriched_df: pd.DataFrame) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_attrition_by_seniority(enriched_df: pd.DataFrame) -> None:
+def render_attrition_by_seniority(seniority_stats: pd.DataFrame | None) -> None:
     """Render attrition rate by seniority level bar chart."""
-    if "seniority_level" not in enriched_df.columns or "employment_status" not in enriched_df.columns:
+    if seniority_stats is None:
         st.info("Seniority level or status data not available")
         return
 
-    # Filter out rows without seniority level
-    df = enriched_df[enriched_df["seniority_level"].notna()].copy()
-
-    if len(df) == 0:
+    if len(seniority_stats) == 0:
         st.info("No seniority level data available")
         return
 
-    # Calculate attrition rate by seniority
-    seniority_stats = df.groupby("seniority_level").agg(
-        total=("employee_id", "count"),
-        attrition=("employment_status", lambda x: (x.isin(["Terminated", "Retired"])).sum())
-    ).reset_index()
-
-    seniority_stats["attrition_rate"] = seniority_stats["attrition"] / seniority_stats["total"] * 100
-    seniority_stats["seniority_level"] = seniority_stats["seniority_level"].astype(int)
+    seniority_stats = seniority_stats.astype({"seniority_level": int})
 
     # Add labels
-    seniority_labels = {
-        1: "1-Entry",
-        2: "2-Junior",
-        3: "3-Mid",
-        4: "4-Senior",
-        5: "5-Executive",
-    }
-    seniority_stats["level_label"] = seniority_stats["seniority_level"].map(seniority_labels)
-
-    # Create color mapping for labels
-    label_colors = {seniority_labels[k]: v for k, v in SENIORITY_COLORS.items()}
+    seniority_stats["level_label"] = label_seniority_levels(seniority_stats["seniority_level"])
 
     fig = create_bar_chart(
         seniority_stats,
@@ -669,7 +667,7 @@ def render_attrition_by_seniority(enriched_df: pd.DataFrame) -> None:
         y="attrition_rate",
         title="Attrition Rate by Seniority Level",
         color="level_label",
-        color_discrete_map=label_colors,
+        color_discrete_map=SENIORITY_LABEL_COLORS,
     )
     fig.update_layout(
         showlegend=False,
@@ -685,25 +683,20 @@ def render_attrition_timeline(employees_df: pd.DataFrame) -> None:
         st.info("Termination date data not available")
         return
 
-    # Filter to terminated/retired employees with valid termination dates
-    termed_df = employees_df[
-        (employees_df["employment_status"].isin(["Terminated", "Retired"])) &
-        (employees_df["termination_date"].notna())
-    ].copy()
+    # Termination years of terminated/retired employees with valid termination dates
+    termination_dates = employees_df["termination_date"]
+    termed = (
+        employees_df["employment_status"].isin(ATTRITION_STATUSES).to_numpy()
+        & termination_dates.notna().to_numpy()
+    )
 
-    if len(termed_df) == 0:
+    if not termed.any():
         st.info("No termination timeline data available")
         return
 
-    # Extract year from termination date
-    termed_df["termination_year"] = pd.to_datetime(termed_df["termination_date"]).dt.year
-
     # Count by year
-    yearly_counts = (
-        termed_df.groupby("termination_year")
-        .size()
-        .reset_index(name="count")
-    )
+    years, counts = np.unique(termination_dates.dt.year.to_numpy()[termed], return_counts=True)
+    yearly_counts = pd.DataFrame({"termination_year": years.astype(int), "count": counts})
 
     fig = create_line_chart(
         yearly_counts,
@@ -2,14 +2,18 @@
 
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
 
 from hr_dashboard.data_manager import enrich_employee_data
 from hr_dashboard.utils.chart_helpers import (
     BU_COLORS,
-    SENIORITY_COLORS,
+    SENIORITY_LABEL_COLORS,
+    count_by,
+    label_seniority_levels,
     create_histogram,
     create_box_plot,
     create_pie_chart,
+    frame_fingerprint,
 )
 
 
@@ -85,15 +89,22 @@ def render_salary_distribution(enriched_df: pd.DataFrame) -> None:
         st.info("Salary data not available")
         return
 
+    fig = _salary_distribution_figure(enriched_df, frame_fingerprint(enriched_df, ["base_salary"]))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _salary_distribution_figure(_enriched_df: pd.DataFrame, fingerprint: int) -> go.Figure:
+    """Build the salary histogram, cached per salary column contents (do not mutate)."""
     fig = create_histogram(
-        enriched_df,
+        _enriched_df,
         x="base_salary",
         title="Salary Distribution",
         nbins=25,
     )
     fig.update_layout(xaxis_title="Base Salary", yaxis_title="Count")
     fig.update_xaxes(tickformat="$,.0f")
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_salary_by_seniority(enriched_df: pd.DataFrame) -> None:
@@ -102,19 +113,19 @@ def render_salary_by_seniority(enriched_df: pd.DataFrame) -> None:
         st.info("Salary or seniority data not available")
         return
 
+    fig = _salary_by_seniority_figure(
+        enriched_df, frame_fingerprint(enriched_df, ["base_salary", "seniority_level"])
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _salary_by_seniority_figure(_enriched_df: pd.DataFrame, fingerprint: int) -> go.Figure:
+    """Build the salary-by-seniority box plot, cached per column contents (do not mutate)."""
     # Add seniority labels
-    seniority_labels = {
-        1: "1-Entry",
-        2: "2-Junior",
-        3: "3-Mid",
-        4: "4-Senior",
-        5: "5-Executive",
-    }
-    df = enriched_df.copy()
-    df["level_label"] = df["seniority_level"].map(seniority_labels)
-
-    # Create color mapping for labels
-    label_colors = {seniority_labels[k]: v for k, v in SENIORITY_COLORS.items()}
+    df = _enriched_df[["base_salary"]].assign(
+        level_label=label_seniority_levels(_enriched_df["seniority_level"])
+    )
 
     fig = create_box_plot(
         df,
@@ -122,11 +133,11 @@ def render_salary_by_seniority(enriched_df: pd.DataFrame) -> None:
         y="base_salary",
         title="Salary by Seniority Level",
         color="level_label",
-        color_discrete_map=label_colors,
+        color_discrete_map=SENIORITY_LABEL_COLORS,
     )
     fig.update_layout(showlegend=False, xaxis_title="Seniority Level", yaxis_title="Base Salary")
     fig.update_yaxes(tickformat="$,.0f")
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_salary_by_business_unit(enriched_df: pd.DataFrame) -> None:
@@ -135,8 +146,17 @@ def render_salary_by_business_unit(enriched_df: pd.DataFrame) -> None:
         st.info("Salary or business unit data not available")
         return
 
+    fig = _salary_by_business_unit_figure(
+        enriched_df, frame_fingerprint(enriched_df, ["base_salary", "business_unit"])
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _salary_by_business_unit_figure(_enriched_df: pd.DataFrame, fingerprint: int) -> go.Figure:
+    """Build the salary-by-business-unit box plot, cached per column contents (do not mutate)."""
     fig = create_box_plot(
-        enriched_df,
+        _enriched_df,
         x="business_unit",
         y="base_salary",
         title="Salary by Business Unit",
@@ -145,7 +165,7 @@ def render_salary_by_business_unit(enriched_df: pd.DataFrame) -> None:
     )
     fig.update_layout(showlegend=False, xaxis_title="Business Unit", yaxis_title="Base Salary")
     fig.update_yaxes(tickformat="$,.0f")
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_change_reasons(comp_df: pd.DataFrame) -> None:
@@ -154,11 +174,7 @@ def render_change_reasons(comp_df: pd.DataFrame) -> None:
         st.info("Change reason data not available")
         return
 
-    reason_counts = (
-        comp_df.groupby("change_reason")
-        .size()
-        .reset_index(name="count")
-    )
+    reason_counts = count_by(comp_df, "change_reason")
 
     fig = create_pie_chart(
         reason_counts,
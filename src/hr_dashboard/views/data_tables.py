@@ -125,5 +125,6 @@ def render_table_details(df: pd.DataFrame, table_name: str) -> None:
                 key=f"cat_col_{table_name}",
             )
             if selected_cat_col:
-                value_counts = display_df[selected_cat_col].value_counts().head(20)
+                value_counts = display_df[selected_cat_col].value_counts()
+                value_counts = value_counts[value_counts > 0].head(20)
                 st.bar_chart(value_counts)
@@ -28,8 +28,13 @@ def render(data: dict[str, pd.DataFrame]) -> None:
         st.warning("Geographic location data not available")
         return
 
-    # Filter out rows with missing coordinates
-    df = enriched_df.dropna(subset=["latitude", "longitude"]).copy()
+    # Filter out rows with missing coordinates, keeping only the columns the map
+    # and summary read so the filter does not copy the whole enriched frame
+    columns = [
+        c for c in ["employee_id", "city", "country", "latitude", "longitude", "base_salary"]
+        if c in enriched_df.columns
+    ]
+    df = enriched_df[columns].dropna(subset=["latitude", "longitude"])
 
     if len(df) == 0:
         st.warning("No employees with valid location data")
@@ -48,37 +53,20 @@ def render(data: dict[str, pd.DataFrame]) -> None:
 def render_employee_map(df: pd.DataFrame) -> None:
     """Render the Plotly scatter map."""
     # Aggregate by location for sizing
-    agg_dict = {"employee_id": "count"}
+    by_location = df.groupby(["city", "country", "latitude", "longitude"], sort=False, observed=True)
+    location_stats = by_location.agg(headcount=("employee_id", "size"))
     if "base_salary" in df.columns:
-        agg_dict["base_salary"] = "mean"
-
-    location_stats = (
-        df.groupby(["city", "country", "latitude", "longitude"])
-        .agg(**{
-            "headcount": ("employee_id", "count"),
-            **({" avg_salary": ("base_salary", "mean")} if "base_salary" in df.columns else {}),
-        })
-        .reset_index()
-    )
-
-    # Rename column if it exists
-    if " avg_salary" in location_stats.columns:
-        location_stats = location_stats.rename(columns={" avg_salary": "avg_salary"})
+        location_stats["avg_salary"] = by_location["base_salary"].mean()
+    location_stats = location_stats.reset_index()
 
-    # Create hover text
+    # Create hover text (vectorized string concatenation)
+    hover_text = (
+        "<b>" + location_stats["city"].astype(str) + ", " + location_stats["country"].astype(str)
+        + "</b><br>Headcount: " + location_stats["headcount"].astype(str)
+    )
     if "avg_salary" in location_stats.columns:
-        location_stats["hover_text"] = location_stats.apply(
-            lambda row: f"<b>{row['city']}, {row['country']}</b><br>"
-                       f"Headcount: {row['headcount']}<br>"
-                       f"Avg Salary: ${row['avg_salary']:,.0f}",
-            axis=1,
-        )
-    else:
-        location_stats["hover_text"] = location_stats.apply(
-            lambda row: f"<b>{row['city']}, {row['country']}</b><br>"
-                       f"Headcount: {row['headcount']}",
-            axis=1,
-        )
+        hover_text += "<br>Avg Salary: $" + location_stats["avg_salary"].map("{:,.0f}".format)
+    location_stats["hover_text"] = hover_text
 
     # Create Plotly scatter mapbox
     fig = px.scatter_mapbox(
@@ -114,29 +102,24 @@ def render_location_summary(df: pd.DataFrame) -> None:
     """Render location summary statistics."""
     st.markdown("### Location Summary")
 
+    # Count once per (city, country); country totals are sums over cities.
+    # Missing cities are kept as a group so they still count towards their country
+    city_counts = df.groupby(["city", "country"], sort=False, observed=True, dropna=False).size()
+
     # By country
     st.markdown("**By Country**")
     country_stats = (
-        df.groupby("country")
-        .agg(
-            headcount=("employee_id", "count"),
-        )
-        .reset_index()
-        .sort_values("headcount", ascending=False)
+        city_counts.groupby(level="country", sort=False, observed=True)
+        .sum()
+        .sort_values(ascending=False)
+        .reset_index(name="headcount")
     )
     st.dataframe(country_stats, use_container_width=True, hide_index=True)
 
     # By city (top 10)
     st.markdown("**Top Cities**")
-    city_stats = (
-        df.groupby(["city", "country"])
-        .agg(
-            headcount=("employee_id", "count"),
-        )
-        .reset_index()
-        .sort_values("headcount", ascending=False)
-        .head(10)
-    )
+    known = city_counts.index.to_frame().notna().all(axis=1).to_numpy()
+    city_stats = city_counts[known].nlargest(10).reset_index(name="headcount")
     st.dataframe(city_stats, use_container_width=True, hide_index=True)
 
     # Total unique locations
@@ -2,10 +2,20 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 
 from hr_dashboard.data_manager import enrich_employee_data
-from hr_dashboard.utils.chart_helpers import BU_COLORS, SENIORITY_COLORS
+from hr_dashboard.utils.chart_helpers import (
+    BU_COLORS,
+    SENIORITY_LABEL_COLORS,
+    label_seniority_levels,
+)
+
+# Path from the root of the treemap down to individual employees
+TREEMAP_PATH = ["business_unit", "org_name", "full_name"]
+
+# Color of nodes whose employees span several color values
+MIXED_NODE_COLOR = "#cccccc"
 
 
 def render(data: dict[str, pd.DataFrame]) -> None:
@@ -44,23 +54,21 @@ def render(data: dict[str, pd.DataFrame]) -> None:
 def render_org_treemap(enriched_df: pd.DataFrame, color_by: str) -> None:
     """Render organization treemap."""
     # Build hierarchy: Business Unit -> Org Name -> Employee
-    df = enriched_df.copy()
-
-    # Filter out rows with missing hierarchy data
     required_cols = ["business_unit", "org_name", "employee_id", "first_name", "last_name"]
     for col in required_cols:
-        if col not in df.columns:
+        if col not in enriched_df.columns:
             st.info(f"Column {col} not available for treemap")
             return
 
-    df = df.dropna(subset=["business_unit", "org_name"])
+    # Work on the needed columns only, filtering out rows with missing hierarchy data
+    columns = required_cols + [c for c in ["seniority_level"] if c in enriched_df.columns]
+    df = enriched_df[columns].dropna(subset=["business_unit", "org_name"])
 
     if len(df) == 0:
         st.info("No data available for treemap after filtering")
         return
 
-    # Create full name
-    df["full_name"] = df["first_name"] + " " + df["last_name"]
+    df = df.assign(full_name=df["first_name"] + " " + df["last_name"])
 
     # Determine color column and mapping
     if color_by == "Business Unit":
@@ -74,26 +82,24 @@ def render_org_treemap(enriched_df: pd.DataFrame, color_by: str) -> None:
             color_map = BU_COLORS
         else:
             # Convert seniority to string labels for better display
-            seniority_labels = {
-                1: "1-Entry",
-                2: "2-Junior",
-                3: "3-Mid",
-                4: "4-Senior",
-                5: "5-Executive",
-            }
-            df["seniority_label"] = df["seniority_level"].map(seniority_labels)
+            df["seniority_label"] = label_seniority_levels(df["seniority_level"])
             color_col = "seniority_label"
-            color_map = {seniority_labels[k]: v for k, v in SENIORITY_COLORS.items()}
-
-    # Create treemap
-    fig = px.treemap(
-        df,
-        path=["business_unit", "org_name", "full_name"],
-        title="Organization Structure",
-        color=color_col,
-        color_discrete_map=color_map,
+            color_map = SENIORITY_LABEL_COLORS
+
+    # Create treemap from pre-aggregated nodes
+    nodes = _treemap_nodes(df, TREEMAP_PATH, color_col)
+    fig = go.Figure(
+        go.Treemap(
+            ids=nodes["id"],
+            labels=nodes["label"],
+            parents=nodes["parent"],
+            values=nodes["count"],
+            branchvalues="total",
+            marker=dict(colors=nodes["color"].map(color_map).fillna(MIXED_NODE_COLOR)),
+        )
     )
     fig.update_layout(
+        title="Organization Structure",
         margin=dict(l=10, r=10, t=60, b=10),
         height=600,
     )
@@ -105,6 +111,54 @@ def render_org_treemap(enriched_df: pd.DataFrame, color_by: str) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
+def _treemap_nodes(df: pd.DataFrame, path: list[str], color_col: str) -> pd.DataFrame:
+    """
+    Aggregate rows into treemap nodes, one per distinct prefix of the path.
+
+    Args:
+        df: Row-level data containing the path and color columns
+        path: Columns from the root level down to the leaves
+        color_col: Column whose value colors each node
+
+    Returns:
+        DataFrame with id, label, parent, count and color columns, leaves first.
+        color is None for nodes whose rows have differing color values.
+    """
+    levels = []
+    for depth in range(len(path), 0, -1):
+        keys = path[:depth]
+        grouped = (
+            df.groupby(keys, sort=False, observed=True)[color_col]
+            .agg(["size", "first", "nunique"])
+            .reset_index()
+        )
+
+        # Ids are the "/"-joined path, so equal labels under different parents stay distinct
+        label = grouped[keys[-1]].astype(str)
+        if depth == 1:
+            parent = pd.Series("", index=grouped.index)
+            node_id = label
+        else:
+            parent = grouped[keys[0]].astype(str)
+            for key in keys[1:-1]:
+                parent = parent + "/" + grouped[key].astype(str)
+            node_id = parent + "/" + label
+
+        levels.append(
+            pd.DataFrame(
+                {
+                    "id": node_id,
+                    "label": label,
+                    "parent": parent,
+                    "count": grouped["size"],
+                    "color": grouped["first"].astype(object).where(grouped["nunique"] == 1),
+                }
+            )
+        )
+
+    return pd.concat(levels, ignore_index=True)
+
+
 def render_org_summary_table(enriched_df: pd.DataFrame, data: dict[str, pd.DataFrame]) -> None:
     """Render organization summary statistics table."""
     st.subheader("Organization Summary")
@@ -113,28 +167,17 @@ def render_org_summary_table(enriched_df: pd.DataFrame, data: dict[str, pd.DataF
 
     # Calculate headcount by org
     if "org_id" in enriched_df.columns:
-        org_headcount = (
-            enriched_df.groupby("org_id")
-            .agg(
-                headcount=("employee_id", "count"),
-                avg_salary=("base_salary", "mean") if "base_salary" in enriched_df.columns else ("employee_id", "count"),
-            )
-            .reset_index()
+        by_org = enriched_df.groupby("org_id", sort=False)
+        org_headcount = by_org.size().rename("headcount").to_frame()
+        if "base_salary" in enriched_df.columns:
+            org_headcount["avg_salary"] = by_org["base_salary"].mean().round(0)
+
+        # Merge with org names (inner join keeps only orgs with headcount > 0)
+        display_cols = ["org_id", "org_name", "business_unit", *org_headcount.columns]
+        org_summary = org_units[["org_id", "org_name", "business_unit"]].merge(
+            org_headcount, left_on="org_id", right_index=True, how="inner", validate="1:1"
         )
 
-        # Merge with org names
-        org_summary = org_units.merge(org_headcount, on="org_id", how="left")
-        org_summary["headcount"] = org_summary["headcount"].fillna(0).astype(int)
-
-        # Select and order columns
-        display_cols = ["org_id", "org_name", "business_unit", "headcount"]
-        if "avg_salary" in org_summary.columns and "base_salary" in enriched_df.columns:
-            org_summary["avg_salary"] = org_summary["avg_salary"].round(0)
-            display_cols.append("avg_salary")
-
-        # Filter to orgs with headcount > 0
-        org_summary = org_summary[org_summary["headcount"] > 0]
-
         # Sort by headcount
         org_summary = org_summary.sort_values("headcount", ascending=False)
 
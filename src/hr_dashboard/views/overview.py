@@ -8,8 +8,10 @@ from datetime import date
 from hr_dashboard.data_manager import enrich_employee_data
 from hr_dashboard.utils.chart_helpers import (
     BU_COLORS,
-    SENIORITY_COLORS,
+    SENIORITY_LABEL_COLORS,
     GENDER_COLORS,
+    count_by,
+    label_seniority_levels,
     create_bar_chart,
     create_pie_chart,
 )
@@ -71,11 +73,10 @@ def render_kpis(enriched_df: pd.DataFrame, data: dict[str, pd.DataFrame]) -> Non
 
     # Average Tenure
     with col3:
-        today = date.today()
-        enriched_df["tenure_years"] = enriched_df["hire_date"].apply(
-            lambda x: (today - x).days / 365.25 if pd.notna(x) else 0
-        )
-        avg_tenure = enriched_df["tenure_years"].mean()
+        # Vectorized date difference (missing hire dates count as zero tenure)
+        hire_dates = pd.to_datetime(enriched_df["hire_date"])
+        tenure_days = (pd.Timestamp(date.today()) - hire_dates).dt.days
+        avg_tenure = (tenure_days.fillna(0) / 365.25).mean()
         st.metric("Avg Tenure", f"{avg_tenure:.1f} years")
 
     # Gender Split
@@ -92,24 +93,10 @@ def render_seniority_distribution(enriched_df: pd.DataFrame) -> None:
         st.info("Seniority level data not available")
         return
 
-    seniority_counts = (
-        enriched_df.groupby("seniority_level")
-        .size()
-        .reset_index(name="count")
-    )
+    seniority_counts = count_by(enriched_df, "seniority_level")
 
     # Add labels
-    seniority_labels = {
-        1: "1-Entry",
-        2: "2-Junior",
-        3: "3-Mid",
-        4: "4-Senior",
-        5: "5-Executive",
-    }
-    seniority_counts["level_label"] = seniority_counts["seniority_level"].map(seniority_labels)
-
-    # Create color mapping for labels
-    label_colors = {seniority_labels[k]: v for k, v in SENIORITY_COLORS.items()}
+    seniority_counts["level_label"] = label_seniority_levels(seniority_counts["seniority_level"])
 
     fig = create_bar_chart(
         seniority_counts,
@@ -117,7 +104,7 @@ def render_seniority_distribution(enriched_df: pd.DataFrame) -> None:
         y="count",
         title="Seniority Level Distribution",
         color="level_label",
-        color_discrete_map=label_colors,
+        color_discrete_map=SENIORITY_LABEL_COLORS,
     )
     fig.update_layout(showlegend=False, xaxis_title="Seniority Level", yaxis_title="Count")
     st.plotly_chart(fig, use_container_width=True)
@@ -125,11 +112,7 @@ def render_seniority_distribution(enriched_df: pd.DataFrame) -> None:
 
 def render_employment_type_breakdown(employees_df: pd.DataFrame) -> None:
     """Render employment type pie chart."""
-    emp_type_counts = (
-        employees_df.groupby("employment_type")
-        .size()
-        .reset_index(name="count")
-    )
+    emp_type_counts = count_by(employees_df, "employment_type")
 
     fig = create_pie_chart(
         emp_type_counts,
@@ -146,11 +129,7 @@ def render_business_unit_distribution(enriched_df: pd.DataFrame) -> None:
         st.info("Business unit data not available")
         return
 
-    bu_counts = (
-        enriched_df.groupby("business_unit")
-        .size()
-        .reset_index(name="count")
-    )
+    bu_counts = count_by(enriched_df, "business_unit")
 
     fig = create_bar_chart(
         bu_counts,
@@ -166,11 +145,7 @@ def render_business_unit_distribution(enriched_df: pd.DataFrame) -> None:
 
 def render_gender_distribution(employees_df: pd.DataFrame) -> None:
     """Render gender distribution pie chart."""
-    gender_counts = (
-        employees_df.groupby("gender")
-        .size()
-        .reset_index(name="count")
-    )
+    gender_counts = count_by(employees_df, "gender")
 
     fig = create_pie_chart(
         gender_counts,
@@ -1,5 +1,6 @@
 """Performance analytics page."""
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -7,6 +8,7 @@ import plotly.express as px
 from hr_dashboard.data_manager import enrich_employee_data
 from hr_dashboard.utils.chart_helpers import (
     BU_COLORS,
+    count_by,
     create_bar_chart,
     create_line_chart,
     create_heatmap,
@@ -29,16 +31,9 @@ def render(data: dict[str, pd.DataFrame]) -> None:
         st.warning("No employees match the current filters.")
         return
 
-    perf_df = data["employee_performance"].copy()
+    perf_df = data["employee_performance"]
     enriched_df = enrich_employee_data(data)
 
-    # Merge with employee data for business unit info
-    perf_enriched = perf_df.merge(
-        enriched_df[["employee_id", "business_unit", "seniority_level"]],
-        on="employee_id",
-        how="left",
-    )
-
     # Summary metrics
     render_performance_kpis(perf_df)
 
@@ -60,39 +55,45 @@ def render(data: dict[str, pd.DataFrame]) -> None:
         render_ratings_by_year_stacked(perf_df)
 
     with col4:
-        render_bu_year_heatmap(perf_enriched)
+        render_bu_year_heatmap(perf_df, enriched_df)
 
 
 def render_performance_kpis(perf_df: pd.DataFrame) -> None:
     """Render performance KPI metrics."""
     col1, col2, col3, col4 = st.columns(4)
 
-    ratings = perf_df["rating"]
+    ratings = perf_df["rating"].to_numpy()
+    total = len(ratings)
+
+    if total and ratings.dtype.kind in "iu" and ratings.min() >= 0:
+        # Integer ratings: one counting pass yields every KPI
+        counts = np.bincount(ratings, minlength=6)
+        avg_rating = counts @ np.arange(len(counts)) / total
+        high_performers = counts[4:].sum()
+        low_performers = counts[:3].sum()
+    else:
+        avg_rating = np.nanmean(ratings) if total else np.nan
+        high_performers = (ratings >= 4).sum()
+        low_performers = (ratings <= 2).sum()
 
     with col1:
-        st.metric("Avg Rating", f"{ratings.mean():.2f}")
+        st.metric("Avg Rating", f"{avg_rating:.2f}")
 
     with col2:
-        st.metric("Total Reviews", f"{len(perf_df):,}")
+        st.metric("Total Reviews", f"{total:,}")
 
     with col3:
-        high_performers = (ratings >= 4).sum()
-        high_pct = high_performers / len(perf_df) * 100
+        high_pct = high_performers / total * 100 if total else np.nan
         st.metric("High Performers (4+)", f"{high_pct:.1f}%")
 
     with col4:
-        low_performers = (ratings <= 2).sum()
-        low_pct = low_performers / len(perf_df) * 100
+        low_pct = low_performers / total * 100 if total else np.nan
         st.metric("Needs Improvement (≤2)", f"{low_pct:.1f}%")
 
 
 def render_rating_distribution(perf_df: pd.DataFrame) -> None:
     """Render rating distribution bar chart."""
-    rating_counts = (
-        perf_df.groupby("rating")
-        .size()
-        .reset_index(name="count")
-    )
+    rating_counts = count_by(perf_df, "rating")
 
     # Define rating colors (red to green scale)
     rating_colors = {
@@ -145,11 +146,7 @@ def render_ratings_by_year_stacked(perf_df: pd.DataFrame) -> None:
         return
 
     # Count ratings by year
-    rating_by_year = (
-        perf_df.groupby(["review_period_year", "rating"])
-        .size()
-        .reset_index(name="count")
-    )
+    rating_by_year = _count_ratings_by_year(perf_df)
 
     # Define rating colors
     rating_colors = {
@@ -178,24 +175,76 @@ def render_ratings_by_year_stacked(perf_df: pd.DataFrame) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_bu_year_heatmap(perf_enriched: pd.DataFrame) -> None:
+def _count_ratings_by_year(perf_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Count reviews per (review year, rating) pair.
+
+    Both keys are small integer domains, so counts come from a single
+    bincount over a flattened year × rating grid instead of a hash groupby.
+
+    Args:
+        perf_df: Performance DataFrame with review_period_year and rating columns
+
+    Returns:
+        DataFrame with review_period_year, rating and count columns, sorted by year
+        then rating, containing only observed pairs
+    """
+    years = perf_df["review_period_year"].to_numpy()
+    ratings = perf_df["rating"].to_numpy()
+
+    integer_keys = years.dtype.kind in "iu" and ratings.dtype.kind in "iu"
+    if len(ratings) == 0 or not integer_keys or ratings.min() < 0:
+        return perf_df.groupby(["review_period_year", "rating"]).size().reset_index(name="count")
+
+    first_year = years.min()
+    n_years = int(years.max() - first_year) + 1
+    n_ratings = int(ratings.max()) + 1
+    counts = np.bincount(
+        (years - first_year).astype(np.intp) * n_ratings + ratings,
+        minlength=n_years * n_ratings,
+    ).reshape(n_years, n_ratings)
+
+    year_idx, rating_idx = np.nonzero(counts)
+    return pd.DataFrame(
+        {
+            "review_period_year": (year_idx + first_year).astype(years.dtype),
+            "rating": rating_idx.astype(ratings.dtype),
+            "count": counts[year_idx, rating_idx],
+        }
+    )
+
+
+def render_bu_year_heatmap(perf_df: pd.DataFrame, enriched_df: pd.DataFrame) -> None:
     """Render heatmap of average rating by business unit and year."""
-    if "review_period_year" not in perf_enriched.columns or "business_unit" not in perf_enriched.columns:
+    if "review_period_year" not in perf_df.columns or "business_unit" not in enriched_df.columns:
         st.info("Business unit or review year data not available")
         return
 
-    # Filter out null business units
-    df = perf_enriched.dropna(subset=["business_unit"])
+    # Join only the columns the heatmap needs; the inner join drops reviews
+    # of employees outside the enriched table, then null business units go too
+    df = perf_df[["employee_id", "review_period_year", "rating"]].merge(
+        enriched_df[["employee_id", "business_unit"]],
+        on="employee_id",
+        how="inner",
+        validate="m:1",
+    ).dropna(subset=["business_unit"])
 
     if len(df) == 0:
         st.info("No data available for heatmap")
         return
 
+    # Average into business unit × year cells before building the figure
+    avg_rating = (
+        df.groupby(["business_unit", "review_period_year"], observed=True)["rating"]
+        .mean()
+        .unstack("review_period_year")
+    )
+
     fig = create_heatmap(
-        df,
+        avg_rating,
         x="review_period_year",
         y="business_unit",
-        z="rating",
+        z=None,
         title="Avg Rating: Business Unit × Year",
         color_scale="RdYlGn",
     )
@@ -0,0 +1,54 @@
+"""Tests for the data health checks."""
+
+from datetime import date
+
+import pandas as pd
+
+from hr_dashboard.utils.data_health import check_attrition_rate, check_headcount_trend
+
+
+def _employees(hire_dates: list, termination_dates: list) -> pd.DataFrame:
+    return pd.DataFrame({
+        "employee_id": [f"E{i}" for i in range(len(hire_dates))],
+        "hire_date": hire_dates,
+        "termination_date": termination_dates,
+    })
+
+
+def test_headcount_trend_warns_on_zero_headcount_year():
+    """Test that a year ending with everyone terminated is flagged."""
+    employees_df = _employees(
+        [date(2020, 3, 1), date(2020, 6, 1), date(2022, 2, 1)],
+        [date(2021, 5, 1), date(2020, 12, 31), None],
+    )
+
+    check = check_headcount_trend(employees_df, 2020, 2022)
+
+    assert check.status == "warning"
+    assert check.message == "Zero headcount in 2021"
+
+
+def test_headcount_trend_without_termination_column():
+    """Test that missing termination data counts everyone hired as active."""
+    employees_df = pd.DataFrame({
+        "employee_id": ["E1", "E2"],
+        "hire_date": [date(2019, 1, 1), date(2020, 7, 1)],
+    })
+
+    check = check_headcount_trend(employees_df, 2019, 2021)
+
+    assert check.status == "pass"
+
+
+def test_attrition_rate_flags_high_attrition_years():
+    """Test that terminations are rated against employees active at year start."""
+    employees_df = _employees(
+        [date(2019, 1, 1), date(2019, 1, 1), date(2019, 1, 1), date(2020, 6, 1)],
+        [date(2020, 3, 1), None, None, date(2021, 2, 1)],
+    )
+
+    check = check_attrition_rate(employees_df, 2020, 2021)
+
+    # 2020: 1 of 3 active left; 2021: 1 of 3 active left
+    assert check.status == "warning"
+    assert check.details == "Years with >30%: [2020, 2021]"
@@ -1,9 +1,13 @@
 """Tests for data_manager module."""
 
+import numpy as np
 import pytest
 import pandas as pd
 from hr_data_generator import generate_hr_data
 
+from hr_dashboard.data_manager import enrich_employee_data, get_filtered_data
+from hr_dashboard.utils.employee_tables import employee_id_lookup, rows_for_employees
+
 
 def test_hr_data_generation():
     """Test that hr_data_generator produces expected data structure."""
@@ -115,3 +119,55 @@ def test_different_seeds_produce_different_data():
 
     # At least one employee should be different
     assert not data1["employee"]["first_name"].equals(data2["employee"]["first_name"])
+
+
+def test_filtered_data_matches_selected_categories():
+    """Test that business unit, seniority and country filters are applied."""
+    data = generate_hr_data(n_employees=50, seed=42)
+    country = data["location"]["country"].iloc[0]
+
+    filtered = get_filtered_data(
+        data,
+        business_units=["Engineering"],
+        seniority_levels=[1, 2, 3],
+        countries=[country],
+    )
+    enriched = enrich_employee_data(filtered)
+
+    assert set(enriched["business_unit"].dropna()) <= {"Engineering"}
+    assert set(enriched["seniority_level"]) <= {1, 2, 3}
+    assert set(enriched["country"]) <= {country}
+
+
+def test_filtered_data_carries_enriched_rows():
+    """Test that filtered data reuses enriched rows for the filtered employees."""
+    data = generate_hr_data(n_employees=50, seed=42)
+
+    filtered = get_filtered_data(data, seniority_levels=[1, 2, 3])
+    enriched = enrich_employee_data(filtered)
+
+    assert enriched["employee_id"].tolist() == filtered["employee"]["employee_id"].tolist()
+    assert enriched is enrich_employee_data(filtered)
+
+
+def test_rows_for_employees_with_id_lookup():
+    """Test that the dense-ID lookup selects the same rows as isin."""
+    df = pd.DataFrame({"employee_id": [3, 1, 4, 1, 5, 9, 2, 6]})
+    selected = np.array([1, 5, 9])
+
+    lookup = employee_id_lookup(np.arange(10), selected)
+    rows = rows_for_employees(df, selected, lookup)
+
+    assert rows.equals(df[df["employee_id"].isin(selected)])
+    assert employee_id_lookup(np.array(["a", "b"], dtype=object), selected) is None
+
+
+def test_select_all_filters_share_unfiltered_tables():
+    """Test that filters keeping every employee return the original tables."""
+    data = generate_hr_data(n_employees=20, seed=42)
+    all_units = data["organization_unit"]["business_unit"].dropna().unique().tolist()
+
+    filtered = get_filtered_data(data, business_units=all_units)
+
+    assert filtered["employee"] is data["employee"]
+    assert filtered["employee_job_assignment"] is data["employee_job_assignment"]
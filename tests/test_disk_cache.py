@@ -0,0 +1,73 @@
+"""Tests for the on-disk dataset cache."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from hr_dashboard.utils import disk_cache
+from hr_dashboard.utils.export import PARQUET_AVAILABLE
+
+pytestmark = pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+
+
+def _sample_data() -> dict[str, pd.DataFrame]:
+    return {
+        "employee": pd.DataFrame({
+            "employee_id": ["E1", "E2"],
+            "hire_date": [date(2020, 1, 1), date(2021, 6, 15)],
+        }),
+        "location": pd.DataFrame({"location_id": ["L1"], "country": ["Japan"]}),
+    }
+
+
+def test_round_trip(tmp_path):
+    """Test that a saved dataset loads back with the same tables."""
+    params = {"n_employees": 2, "seed": 42, "start_date": date(2020, 1, 1)}
+    data = _sample_data()
+
+    disk_cache.save_cached_dataset(params, data, cache_dir=tmp_path)
+    loaded = disk_cache.load_cached_dataset(params, cache_dir=tmp_path)
+
+    assert loaded is not None
+    assert set(loaded) == set(data)
+    for name, df in data.items():
+        pd.testing.assert_frame_equal(loaded[name], df)
+
+
+def test_miss_for_different_params(tmp_path):
+    """Test that different parameters do not hit another entry."""
+    disk_cache.save_cached_dataset({"seed": 1}, _sample_data(), cache_dir=tmp_path)
+
+    assert disk_cache.load_cached_dataset({"seed": 2}, cache_dir=tmp_path) is None
+
+
+def test_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Test that only MAX_CACHE_ENTRIES datasets are kept."""
+    monkeypatch.setattr(disk_cache, "MAX_CACHE_ENTRIES", 2)
+
+    for seed in range(3):
+        disk_cache.save_cached_dataset({"seed": seed}, _sample_data(), cache_dir=tmp_path)
+
+    entries = [p for p in tmp_path.iterdir() if not p.name.startswith(".")]
+    assert len(entries) == 2
+
+
+def test_miss_after_generator_upgrade(tmp_path, monkeypatch):
+    """Test that datasets cached by another generator version are not reused."""
+    params = {"seed": 1}
+    disk_cache.save_cached_dataset(params, _sample_data(), cache_dir=tmp_path)
+
+    monkeypatch.setattr(disk_cache, "GENERATOR_VERSION", "999.0")
+
+    assert disk_cache.load_cached_dataset(params, cache_dir=tmp_path) is None
+
+
+def test_miss_for_entry_without_tables(tmp_path):
+    """Test that an entry whose tables were removed is a miss, not an empty dataset."""
+    params = {"seed": 1}
+    disk_cache.save_cached_dataset(params, _sample_data(), cache_dir=tmp_path)
+    for path in tmp_path.glob("*/*.parquet"):
+        path.unlink()
+
+    assert disk_cache.load_cached_dataset(params, cache_dir=tmp_path) is None
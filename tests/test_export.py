@@ -0,0 +1,54 @@
+"""Tests for the data export helpers."""
+
+import io
+from datetime import date, datetime
+
+import pandas as pd
+
+from hr_dashboard.utils.export import export_to_csv
+
+
+def test_csv_export_round_trips():
+    """Test that exported CSV reads back to the same values."""
+    df = pd.DataFrame({
+        "employee_id": ["E1", "E2", "E3"],
+        "business_unit": pd.Categorical(["Sales", "Engineering, Core", "Sales"]),
+        "base_salary": [85000.0, None, 120500.5],
+        "seniority_level": [1, 3, 5],
+        "hire_date": [date(2020, 1, 1), date(2021, 6, 15), None],
+    })
+
+    loaded = pd.read_csv(io.BytesIO(export_to_csv(df)), keep_default_na=False, na_values=[""])
+
+    assert loaded.columns.tolist() == df.columns.tolist()
+    assert loaded["business_unit"].tolist() == ["Sales", "Engineering, Core", "Sales"]
+    assert loaded["base_salary"].tolist()[::2] == [85000.0, 120500.5]
+    assert loaded["base_salary"].isna().tolist() == [False, True, False]
+    assert loaded["seniority_level"].tolist() == [1, 3, 5]
+    assert loaded["hire_date"].tolist()[:2] == ["2020-01-01", "2021-06-15"]
+
+
+def test_csv_export_keeps_pandas_formatting_for_timestamps():
+    """Test that datetime columns are written as plain dates."""
+    df = pd.DataFrame({"review_date": pd.to_datetime(["2024-03-31"]), "active": [True]})
+
+    assert export_to_csv(df) == b"review_date,active\n2024-03-31,True\n"
+
+
+def test_csv_export_keeps_pandas_formatting_for_object_columns():
+    """Test that bools and datetimes stored in object columns use pandas' formatting."""
+    df = pd.DataFrame({
+        "active": pd.Series([True, None], dtype=object),
+        "reviewed_at": pd.Series([datetime(2024, 3, 31), None], dtype=object),
+    })
+
+    assert export_to_csv(df) == b"active,reviewed_at\nTrue,2024-03-31 00:00:00\n,\n"
+
+
+def test_csv_export_falls_back_for_nested_values():
+    """Test that list- and dict-valued columns, which Arrow cannot write as CSV, still export."""
+    df = pd.DataFrame({"skills": [["sql", "python"], ["excel"]], "meta": [{"a": 1}, {"a": 2}]})
+
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, lineterminator="\n")
+    assert export_to_csv(df) == buffer.getvalue()
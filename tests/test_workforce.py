@@ -0,0 +1,17 @@
+"""Tests for the workforce headcount helpers."""
+
+import numpy as np
+
+from hr_dashboard.utils.workforce import headcount_at
+
+
+def test_headcount_at_boundary_sides():
+    """Test that hires and terminations on a boundary date fall on the chosen side."""
+    hire_dates = np.array(["2020-01-01", "2020-06-01", "NaT"], dtype="datetime64[ns]")
+    termination_dates = np.array(["2021-01-01", "NaT", "NaT"], dtype="datetime64[ns]")
+    boundaries = np.array(["2020-01-01", "2021-01-01"], dtype="datetime64[ns]")
+
+    # hire <= boundary < termination
+    assert headcount_at(hire_dates, termination_dates, boundaries, side="right").tolist() == [1, 1]
+    # hire < boundary <= termination
+    assert headcount_at(hire_dates, termination_dates, boundaries, side="left").tolist() == [0, 2]